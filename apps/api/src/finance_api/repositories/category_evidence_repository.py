@@ -65,7 +65,7 @@ class CategoryEvidenceRepository:
         Returns:
             The created CategoryEvidence.
         """
-        evidence = CategoryEvidence(
+        evidence = self._new_evidence(
             transaction_id=transaction_id,
             item_description=item_description,
             item_price=item_price,
@@ -88,20 +88,76 @@ class CategoryEvidenceRepository:
     def create_batch(
         self, evidence_list: list[dict[str, Any]]
     ) -> list[CategoryEvidence]:
-        """Create multiple category evidence records.
+        """Create multiple category evidence records with a single flush.
 
         Args:
-            evidence_list: List of dictionaries with evidence data.
+            evidence_list: List of dictionaries with the arguments of create().
 
         Returns:
-            List of created CategoryEvidence records.
+            List of created CategoryEvidence records, in input order.
         """
-        created = []
-        for evidence_data in evidence_list:
-            evidence = self.create(**evidence_data)
-            created.append(evidence)
+        created = [
+            self._new_evidence(**evidence_data) for evidence_data in evidence_list
+        ]
+        self._session.add_all(created)
+        self._session.flush()
         return created
 
+    def _new_evidence(
+        self,
+        transaction_id: int,
+        item_description: str,
+        item_price: Decimal,
+        category_id: int,
+        evidence_type: str,
+        item_currency: str = "GBP",
+        item_quantity: int = 1,
+        email_account_id: int | None = None,
+        email_message_id: str | None = None,
+        email_datetime: datetime | None = None,
+        evidence_summary: str | None = None,
+        confidence_score: Decimal | None = None,
+        model_used: str | None = None,
+        raw_extraction: str | None = None,
+    ) -> CategoryEvidence:
+        """Build a not yet persisted category evidence record.
+
+        Args:
+            transaction_id: The transaction ID.
+            item_description: Description of the item.
+            item_price: Price of the item.
+            category_id: The assigned category ID.
+            evidence_type: Type of evidence (email, manual, rule, ai_inferred).
+            item_currency: Currency code (default GBP).
+            item_quantity: Quantity of items (default 1).
+            email_account_id: Source email account ID.
+            email_message_id: Email Message-ID header.
+            email_datetime: When the email was sent.
+            evidence_summary: Human-readable summary.
+            confidence_score: AI confidence (0-1).
+            model_used: LLM model identifier.
+            raw_extraction: Full LLM JSON output.
+
+        Returns:
+            The new CategoryEvidence.
+        """
+        return CategoryEvidence(
+            transaction_id=transaction_id,
+            item_description=item_description,
+            item_price=item_price,
+            item_currency=item_currency,
+            item_quantity=item_quantity,
+            category_id=category_id,
+            evidence_type=evidence_type,
+            email_account_id=email_account_id,
+            email_message_id=email_message_id,
+            email_datetime=email_datetime,
+            evidence_summary=evidence_summary,
+            confidence_score=confidence_score,
+            model_used=model_used,
+            raw_extraction=raw_extraction,
+        )
+
     def get(self, evidence_id: int) -> CategoryEvidence:
         """Get a category evidence record by ID.
 
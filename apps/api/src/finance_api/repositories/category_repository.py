@@ -2,7 +2,7 @@
 
 from decimal import Decimal
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, literal, select
 from sqlalchemy.orm import Session
 
 from finance_api.models.category import Category, CategoryClosure
@@ -87,19 +87,17 @@ class CategoryRepository:
 
         # 2. Copy all ancestor entries from parent if exists
         if parent_id is not None:
-            # Get all ancestors of the parent (including the parent itself)
-            stmt = select(CategoryClosure).where(
-                CategoryClosure.descendant_id == parent_id
+            # All ancestors of the parent (including the parent itself) become
+            # ancestors one level further away, in a single INSERT ... SELECT
+            stmt = insert(CategoryClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(
+                    CategoryClosure.ancestor_id,
+                    literal(category.id),
+                    CategoryClosure.depth + 1,
+                ).where(CategoryClosure.descendant_id == parent_id),
             )
-            parent_ancestors = self._session.execute(stmt).scalars().all()
-
-            for ancestor_entry in parent_ancestors:
-                new_closure = CategoryClosure(
-                    ancestor_id=ancestor_entry.ancestor_id,
-                    descendant_id=category.id,
-                    depth=ancestor_entry.depth + 1,
-                )
-                self._session.add(new_closure)
+            self._session.execute(stmt)
 
         return category
 
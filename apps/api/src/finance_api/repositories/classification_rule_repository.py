@@ -1,5 +1,7 @@
 """ClassificationRuleRepository for managing classification rules."""
 
+from typing import Any
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -43,18 +45,60 @@ class ClassificationRuleRepository:
         Returns:
             The created ClassificationRule.
         """
-        rule = ClassificationRule(
+        rule = self._new_rule(
             name=name,
             rule_expression=rule_expression,
             category_id=category_id,
             priority=priority,
             requires_disambiguation=requires_disambiguation,
-            is_active=True,
         )
         self._session.add(rule)
         self._session.flush()
         return rule
 
+    def create_batch(self, rule_list: list[dict[str, Any]]) -> list[ClassificationRule]:
+        """Create multiple classification rules with a single flush.
+
+        Args:
+            rule_list: List of dictionaries with the arguments of create().
+
+        Returns:
+            List of created ClassificationRule records, in input order.
+        """
+        rules = [self._new_rule(**rule_data) for rule_data in rule_list]
+        self._session.add_all(rules)
+        self._session.flush()
+        return rules
+
+    def _new_rule(
+        self,
+        name: str,
+        rule_expression: str,
+        category_id: int,
+        priority: int = 0,
+        requires_disambiguation: bool = False,
+    ) -> ClassificationRule:
+        """Build an active, not yet persisted classification rule.
+
+        Args:
+            name: Human-readable rule name.
+            rule_expression: The rule-engine expression.
+            category_id: Target category ID.
+            priority: Evaluation priority (lower = higher priority).
+            requires_disambiguation: Whether AI disambiguation is needed after match.
+
+        Returns:
+            The new ClassificationRule.
+        """
+        return ClassificationRule(
+            name=name,
+            rule_expression=rule_expression,
+            category_id=category_id,
+            priority=priority,
+            requires_disambiguation=requires_disambiguation,
+            is_active=True,
+        )
+
     def get(self, rule_id: int) -> ClassificationRule:
         """Get a classification rule by ID.
 
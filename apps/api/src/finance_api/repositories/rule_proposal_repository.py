@@ -25,6 +25,8 @@ class RuleProposalRepository:
             session: SQLAlchemy database session.
         """
         self._session = session
+        # cluster_hash -> proposal ID for proposals created or found here
+        self._hash_cache: dict[str, int] = {}
 
     def create(
         self,
@@ -73,6 +75,7 @@ class RuleProposalRepository:
         )
         self._session.add(proposal)
         self._session.flush()
+        self._hash_cache.setdefault(cluster_hash, proposal.id)
         return proposal
 
     def get(self, proposal_id: int) -> RuleProposal:
@@ -119,14 +122,28 @@ class RuleProposalRepository:
     def get_by_cluster_hash(self, cluster_hash: str) -> RuleProposal | None:
         """Get a proposal by cluster hash to avoid duplicates.
 
+        Proposals this repository has already created or found are resolved
+        through the session's identity map instead of a query.
+
         Args:
             cluster_hash: The cluster hash to search for.
 
         Returns:
             The RuleProposal if found, None otherwise.
         """
+        proposal_id = self._hash_cache.get(cluster_hash)
+        if proposal_id is not None:
+            proposal = self._session.get(RuleProposal, proposal_id)
+            if proposal is not None and proposal.cluster_hash == cluster_hash:
+                return proposal
+
         stmt = select(RuleProposal).where(RuleProposal.cluster_hash == cluster_hash)
-        return self._session.execute(stmt).scalars().first()
+        proposal = self._session.execute(stmt).scalars().first()
+        if proposal is None:
+            self._hash_cache.pop(cluster_hash, None)
+        else:
+            self._hash_cache[cluster_hash] = proposal.id
+        return proposal
 
     def get_all(self) -> list[RuleProposal]:
         """Get all rule proposals.
@@ -232,6 +249,7 @@ class RuleProposalRepository:
             RuleProposalNotFoundError: If proposal doesn't exist.
         """
         proposal = self.get(proposal_id)
+        self._hash_cache.pop(proposal.cluster_hash, None)
         self._session.delete(proposal)
 
     def count_by_status(self) -> dict[str, int]:
@@ -168,7 +168,7 @@ async def create_session(
 
     # Store proposals and validate them
     all_transactions = list(db.query(Transaction).all())
-    cluster_ids = {t.id for t in cluster.transactions}
+    cluster_ids = cluster.transaction_ids
 
     for rule in response.proposed_rules:
         proposal = session_repo.add_proposal(
@@ -354,9 +354,7 @@ async def send_message(
             (c for c in clusters if c.cluster_hash == session.cluster_hash),
             None,
         )
-        cluster_ids = (
-            {t.id for t in cluster_full.transactions} if cluster_full else set()
-        )
+        cluster_ids = cluster_full.transaction_ids if cluster_full else frozenset()
 
         for rule in response.proposed_rules:
             proposal = session_repo.add_proposal(
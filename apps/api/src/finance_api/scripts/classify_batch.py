@@ -4,6 +4,8 @@ import argparse
 from datetime import datetime
 
 from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from finance_api.db.session import SessionLocal
 from finance_api.models.category import Category
@@ -73,17 +75,23 @@ def print_stats_report(db) -> None:  # type: ignore[no-untyped-def]
     print()
 
 
-def get_uncategorized_transactions(db) -> list[Transaction]:  # type: ignore[no-untyped-def]
-    """Get all transactions without a category."""
-    categorized_ids = (
-        db.query(TransactionCategory.transaction_id)
+def get_uncategorized_transactions(db: Session) -> list[Transaction]:
+    """Get all transactions without a category.
+
+    The query only returns transactions with no category link, so each one's
+    category_link is set to None up front. Applying classifications then
+    doesn't issue a lazy load per transaction.
+    """
+    categorized = (
+        db.query(TransactionCategory.id)
+        .filter(TransactionCategory.transaction_id == Transaction.id)
         .filter(TransactionCategory.category_id.isnot(None))
-        .all()
+        .exists()
     )
-    categorized_id_set = {r[0] for r in categorized_ids}
-
-    all_txns = db.query(Transaction).all()
-    return [t for t in all_txns if t.id not in categorized_id_set]
+    transactions = db.query(Transaction).filter(~categorized).all()
+    for transaction in transactions:
+        set_committed_value(transaction, "category_link", None)
+    return transactions
 
 
 def run_classification(
@@ -129,6 +137,7 @@ def run_classification(
 
         # Classify transactions
         results = classification_service.classify_batch(uncategorized)
+        transactions_by_id = {txn.id: txn for txn in uncategorized}
 
         # Count results
         matched = sum(1 for r in results.values() if r is not None)
@@ -144,11 +153,7 @@ def run_classification(
                     continue
 
                 # Check if already has a category assignment
-                existing = (
-                    db.query(TransactionCategory)
-                    .filter(TransactionCategory.transaction_id == txn_id)
-                    .first()
-                )
+                existing = transactions_by_id[txn_id].category_link
 
                 if existing:
                     # Update existing
@@ -181,7 +186,7 @@ def run_classification(
                 if match is None or count >= 10:
                     continue
 
-                txn = db.query(Transaction).get(txn_id)
+                txn = transactions_by_id.get(txn_id)
                 if txn:
                     print(f"  {txn.description[:50]}")
                     print(f"    → Rule: {match.rule.name}")
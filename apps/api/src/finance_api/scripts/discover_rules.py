@@ -8,6 +8,9 @@ Multi-stage classification pipeline:
 import argparse
 from typing import Any
 
+from anthropic import Anthropic
+from sqlalchemy.orm import Session
+
 from finance_api.db.session import SessionLocal
 from finance_api.models.category import Category
 from finance_api.models.session_rule_proposal import SessionRuleProposal
@@ -40,17 +43,15 @@ from finance_api.services.transaction_clustering_service import (
 )
 
 
-def get_uncategorized_transactions(db: Any) -> list[Transaction]:
+def get_uncategorized_transactions(db: Session) -> list[Transaction]:
     """Get all transactions without a category."""
-    categorized_ids = (
-        db.query(TransactionCategory.transaction_id)
+    categorized = (
+        db.query(TransactionCategory.id)
+        .filter(TransactionCategory.transaction_id == Transaction.id)
         .filter(TransactionCategory.category_id.isnot(None))
-        .all()
+        .exists()
     )
-    categorized_id_set = {r[0] for r in categorized_ids}
-
-    all_txns = db.query(Transaction).all()
-    return [t for t in all_txns if t.id not in categorized_id_set]
+    return db.query(Transaction).filter(~categorized).all()
 
 
 def display_cluster(
@@ -249,6 +250,7 @@ def run_pattern_detection_stage(
     rule_repo: ClassificationRuleRepository,
     db: Any,
     threshold: float = 0.10,
+    client: Anthropic | None = None,
 ) -> tuple[set[int], list[str]]:
     """Run Stage 1: High-frequency pattern detection.
 
@@ -258,6 +260,7 @@ def run_pattern_detection_stage(
         rule_repo: Repository for creating rules.
         db: Database session.
         threshold: Minimum frequency for pattern detection.
+        client: Shared Anthropic client for LLM calls.
 
     Returns:
         Tuple of (categorized_transaction_ids, strip_patterns)
@@ -279,7 +282,7 @@ def run_pattern_detection_stage(
     print()
 
     # Initialize LLM service for pattern explanation
-    discovery_service = RuleDiscoveryService()
+    discovery_service = RuleDiscoveryService(client=client)
 
     categorized_ids: set[int] = set()
     strip_patterns: list[str] = []
@@ -473,7 +476,7 @@ def run_interactive_refinement(
 
             # Run validation and store proposals
             if response.proposed_rules:
-                cluster_ids = {t.id for t in cluster.transactions}
+                cluster_ids = cluster.transaction_ids
                 validated = refinement_service.validate_proposals(
                     response.proposed_rules, all_transactions, cluster_ids
                 )
@@ -572,7 +575,7 @@ def run_interactive_refinement(
 
                 # Validate and store new proposals
                 if response.proposed_rules:
-                    cluster_ids = {t.id for t in cluster.transactions}
+                    cluster_ids = cluster.transaction_ids
                     validated = refinement_service.validate_proposals(
                         response.proposed_rules, all_transactions, cluster_ids
                     )
@@ -699,6 +702,8 @@ def run_discovery(
         category_repo = CategoryRepository(db)
         rule_repo = ClassificationRuleRepository(db)
         proposal_repo = RuleProposalRepository(db)
+        # One client (and connection pool) shared by both LLM stages
+        client = None if analyze_only else Anthropic()
 
         # Get all transactions and categories
         all_transactions = list(db.query(Transaction).all())
@@ -736,6 +741,7 @@ def run_discovery(
                 rule_repo=rule_repo,
                 db=db,
                 threshold=pattern_threshold,
+                client=client,
             )
 
             # Filter out categorized transactions for Stage 2
@@ -788,7 +794,7 @@ def run_discovery(
 
         # Initialize services for interactive refinement
         session_repo = RefinementSessionRepository(db)
-        refinement_service = InteractiveRefinementService()
+        refinement_service = InteractiveRefinementService(client=client)
 
         # Process clusters with interactive refinement
         clusters_to_process = clusters[:max_clusters] if max_clusters else clusters
@@ -19,6 +19,14 @@ from finance_api.services.rules_classification_service import (
     RulesClassificationService,
 )
 
+# Confidence reported for rule-based results. Decimals are immutable, so one
+# instance of each is shared by every result.
+_RULE_CONFIDENCE = Decimal("1.0")
+# Rule needs disambiguation but no disambiguation service is available
+_UNDISAMBIGUATED_RULE_CONFIDENCE = Decimal("0.7")
+# Disambiguation found no category and the rule's category is used instead
+_RULE_FALLBACK_CONFIDENCE = Decimal("0.5")
+
 
 @dataclass
 class ClassificationResult:
@@ -56,6 +64,9 @@ class ClassificationOrchestrator:
         transaction_category_updater: (
             Callable[[int, int], TransactionCategory] | None
         ) = None,
+        transaction_category_batch_updater: (
+            Callable[[list[tuple[int, int]]], None] | None
+        ) = None,
     ) -> None:
         """Initialize the orchestrator.
 
@@ -64,21 +75,44 @@ class ClassificationOrchestrator:
             disambiguation_service: Service for AI disambiguation (optional).
             evidence_repository: Repository for evidence records.
             transaction_category_updater: Callback to assign category to transaction.
+            transaction_category_batch_updater: Callback to assign categories to
+                many transactions at once, given (transaction_id, category_id)
+                pairs. When set, classify_batch() collects its assignments and
+                makes one call with all of them. Used for single assignments
+                too when transaction_category_updater is not given.
         """
         self._rules_service = rules_service
         self._disambiguation_service = disambiguation_service
         self._evidence_repo = evidence_repository
         self._category_updater = transaction_category_updater
+        self._category_batch_updater = transaction_category_batch_updater
 
-    def _assign_category(self, transaction_id: int, category_id: int) -> None:
+    def _assign_category(
+        self,
+        transaction_id: int,
+        category_id: int,
+        assignments: list[tuple[int, int]] | None = None,
+    ) -> None:
         """Assign a category to a transaction.
 
+        When an assignments list is given (classify_batch() with a batch
+        updater), the assignment is collected there and made once the batch
+        is classified. Otherwise it goes through the per-transaction updater,
+        or through the batch updater as a batch of one if that is the only
+        updater.
+
         Args:
             transaction_id: The transaction ID.
             category_id: The category ID to assign.
+            assignments: Batch assignments to collect into, or None to
+                assign immediately.
         """
-        if self._category_updater:
+        if assignments is not None:
+            assignments.append((transaction_id, category_id))
+        elif self._category_updater:
             self._category_updater(transaction_id, category_id)
+        elif self._category_batch_updater:
+            self._category_batch_updater([(transaction_id, category_id)])
 
     def _is_already_classified(self, transaction: Transaction) -> bool:
         """Check if a transaction is already classified.
@@ -96,6 +130,7 @@ class ClassificationOrchestrator:
         transaction: Transaction,
         force: bool = False,
         background_tasks: BackgroundTasks | None = None,
+        existing_category_id: int | None = None,
     ) -> ClassificationResult:
         """Classify a single transaction.
 
@@ -103,30 +138,72 @@ class ClassificationOrchestrator:
             transaction: The transaction to classify.
             force: If True, reclassify even if already classified.
             background_tasks: FastAPI BackgroundTasks for async disambiguation.
+            existing_category_id: Category already assigned to the transaction,
+                if the caller knows it. Skips loading the transaction's category
+                link for the idempotency check.
 
         Returns:
             ClassificationResult with outcome.
         """
         # Idempotency check
-        if not force and self._is_already_classified(transaction):
-            return ClassificationResult(
-                transaction_id=transaction.id,
-                classified=True,
-                category_id=(
-                    transaction.category_link.category_id
-                    if transaction.category_link
-                    else None
-                ),
-                method="existing",
-            )
+        if not force:
+            if existing_category_id is not None:
+                return self._existing_result(transaction, existing_category_id)
+            if self._is_already_classified(transaction):
+                return self._existing_result(transaction)
 
         # Step 1: Try rules-based classification
         rule_match = self._rules_service.classify(transaction)
 
+        return self._classify_from_rule_match(transaction, rule_match, background_tasks)
+
+    def _existing_result(
+        self, transaction: Transaction, category_id: int | None = None
+    ) -> ClassificationResult:
+        """Build the result for a transaction that is already classified.
+
+        Args:
+            transaction: The already classified transaction.
+            category_id: The existing category, if known. Otherwise it is read
+                from the transaction's category link.
+
+        Returns:
+            ClassificationResult carrying the existing category.
+        """
+        if category_id is None and transaction.category_link:
+            category_id = transaction.category_link.category_id
+        return ClassificationResult(
+            transaction_id=transaction.id,
+            classified=True,
+            category_id=category_id,
+            method="existing",
+        )
+
+    def _classify_from_rule_match(
+        self,
+        transaction: Transaction,
+        rule_match: RuleMatch | None,
+        background_tasks: BackgroundTasks | None = None,
+        assignments: list[tuple[int, int]] | None = None,
+    ) -> ClassificationResult:
+        """Finish classifying a transaction once its rule match is known.
+
+        Args:
+            transaction: The transaction to classify.
+            rule_match: The matching rule, or None if no rule matched.
+            background_tasks: FastAPI BackgroundTasks for async disambiguation.
+            assignments: Batch assignments to collect into, or None to
+                assign immediately.
+
+        Returns:
+            ClassificationResult with outcome.
+        """
         if rule_match is not None:
             if not rule_match.requires_disambiguation:
                 # Direct assignment
-                self._assign_category(transaction.id, rule_match.category_id)
+                self._assign_category(
+                    transaction.id, rule_match.category_id, assignments
+                )
 
                 # Store rule evidence for audit trail
                 self._evidence_repo.create(
@@ -141,7 +218,7 @@ class ClassificationOrchestrator:
                         f"Matched rule '{rule_match.rule.name}': "
                         f"{rule_match.rule.rule_expression}"
                     ),
-                    confidence_score=Decimal("1.0"),
+                    confidence_score=_RULE_CONFIDENCE,
                 )
 
                 return ClassificationResult(
@@ -150,7 +227,7 @@ class ClassificationOrchestrator:
                     category_id=rule_match.category_id,
                     method="rule",
                     rule_name=rule_match.rule.name,
-                    confidence=Decimal("1.0"),
+                    confidence=_RULE_CONFIDENCE,
                 )
             else:
                 # Rule matched but needs AI disambiguation
@@ -170,17 +247,21 @@ class ClassificationOrchestrator:
                     )
                 elif self._disambiguation_service:
                     # Run synchronously
-                    return self._classify_with_disambiguation(transaction, rule_match)
+                    return self._classify_with_disambiguation(
+                        transaction, rule_match, assignments
+                    )
                 else:
                     # No disambiguation service - use rule category as best effort
-                    self._assign_category(transaction.id, rule_match.category_id)
+                    self._assign_category(
+                        transaction.id, rule_match.category_id, assignments
+                    )
                     return ClassificationResult(
                         transaction_id=transaction.id,
                         classified=True,
                         category_id=rule_match.category_id,
                         method="rule_with_disambiguation",
                         rule_name=rule_match.rule.name,
-                        confidence=Decimal("0.7"),
+                        confidence=_UNDISAMBIGUATED_RULE_CONFIDENCE,
                         needs_disambiguation=True,
                     )
 
@@ -200,7 +281,9 @@ class ClassificationOrchestrator:
                     needs_disambiguation=True,
                 )
             else:
-                return self._classify_with_disambiguation(transaction, None)
+                return self._classify_with_disambiguation(
+                    transaction, None, assignments
+                )
 
         # No classification possible
         return ClassificationResult(
@@ -215,12 +298,15 @@ class ClassificationOrchestrator:
         self,
         transaction: Transaction,
         rule_match: RuleMatch | None,
+        assignments: list[tuple[int, int]] | None = None,
     ) -> ClassificationResult:
         """Classify using AI disambiguation.
 
         Args:
             transaction: The transaction to classify.
             rule_match: Optional rule match that flagged disambiguation.
+            assignments: Batch assignments to collect into, or None to
+                assign immediately.
 
         Returns:
             ClassificationResult with outcome.
@@ -237,7 +323,9 @@ class ClassificationOrchestrator:
         result = self._disambiguation_service.disambiguate(transaction)
 
         if result.success and result.dominant_category_id:
-            self._assign_category(transaction.id, result.dominant_category_id)
+            self._assign_category(
+                transaction.id, result.dominant_category_id, assignments
+            )
             return ClassificationResult(
                 transaction_id=transaction.id,
                 classified=True,
@@ -247,7 +335,9 @@ class ClassificationOrchestrator:
             )
         elif result.dominant_category_id:
             # Partial success - has category but low confidence
-            self._assign_category(transaction.id, result.dominant_category_id)
+            self._assign_category(
+                transaction.id, result.dominant_category_id, assignments
+            )
             return ClassificationResult(
                 transaction_id=transaction.id,
                 classified=True,
@@ -258,14 +348,14 @@ class ClassificationOrchestrator:
             )
         elif rule_match:
             # Fall back to rule category
-            self._assign_category(transaction.id, rule_match.category_id)
+            self._assign_category(transaction.id, rule_match.category_id, assignments)
             return ClassificationResult(
                 transaction_id=transaction.id,
                 classified=True,
                 category_id=rule_match.category_id,
                 method="rule_with_disambiguation",
                 rule_name=rule_match.rule.name,
-                confidence=Decimal("0.5"),
+                confidence=_RULE_FALLBACK_CONFIDENCE,
                 error_message=result.error_message,
             )
         else:
@@ -299,6 +389,11 @@ class ClassificationOrchestrator:
     ) -> dict[int, ClassificationResult]:
         """Classify multiple transactions.
 
+        Rule matching for every transaction that needs classifying is done in
+        one RulesClassificationService.classify_batch() call, which resolves
+        the rules once for the whole batch. With a batch category updater, all
+        category assignments are made in a single call at the end.
+
         Args:
             transactions: List of transactions to classify.
             force: If True, reclassify even if already classified.
@@ -307,14 +402,84 @@ class ClassificationOrchestrator:
         Returns:
             Dictionary mapping transaction ID to ClassificationResult.
         """
+        return self._classify_batch(transactions, force, background_tasks, None)
+
+    def classify_batch_with_statistics(
+        self,
+        transactions: list[Transaction],
+        force: bool = False,
+        background_tasks: BackgroundTasks | None = None,
+    ) -> tuple[dict[int, ClassificationResult], dict[str, int]]:
+        """Classify multiple transactions and gather statistics in one pass.
+
+        Equivalent to classify_batch() followed by
+        get_classification_statistics(), but each result is counted as it is
+        produced instead of in a second pass over the results.
+
+        Args:
+            transactions: List of transactions to classify.
+            force: If True, reclassify even if already classified.
+            background_tasks: FastAPI BackgroundTasks for async disambiguation.
+
+        Returns:
+            Tuple of (results by transaction ID, counts by method).
+        """
+        stats = self._empty_statistics()
+        results = self._classify_batch(transactions, force, background_tasks, stats)
+        stats["total"] = len(results)
+        return results, stats
+
+    def _classify_batch(
+        self,
+        transactions: list[Transaction],
+        force: bool,
+        background_tasks: BackgroundTasks | None,
+        stats: dict[str, int] | None,
+    ) -> dict[int, ClassificationResult]:
+        """Classify multiple transactions, optionally counting the results.
+
+        Args:
+            transactions: List of transactions to classify.
+            force: If True, reclassify even if already classified.
+            background_tasks: FastAPI BackgroundTasks for async disambiguation.
+            stats: Statistics to update with each result, or None.
+
+        Returns:
+            Dictionary mapping transaction ID to ClassificationResult.
+        """
+        pending = [
+            transaction
+            for transaction in transactions
+            if force or not self._is_already_classified(transaction)
+        ]
+        rule_matches = self._rules_service.classify_batch(pending)
+
         results: dict[int, ClassificationResult] = {}
+        # Collected only with a batch updater; otherwise each assignment is
+        # made as it happens
+        assignments: list[tuple[int, int]] | None = (
+            [] if self._category_batch_updater else None
+        )
 
-        for transaction in transactions:
-            results[transaction.id] = self.classify(
-                transaction,
-                force=force,
-                background_tasks=background_tasks,
-            )
+        try:
+            for transaction in transactions:
+                if transaction.id in rule_matches:
+                    result = self._classify_from_rule_match(
+                        transaction,
+                        rule_matches[transaction.id],
+                        background_tasks,
+                        assignments,
+                    )
+                else:
+                    result = self._existing_result(transaction)
+                results[transaction.id] = result
+                if stats is not None:
+                    self._count_result(stats, result)
+        finally:
+            # Evidence for these assignments is already recorded, so they are
+            # made even if a later transaction in the batch raised
+            if assignments and self._category_batch_updater:
+                self._category_batch_updater(assignments)
 
         return results
 
@@ -329,8 +494,22 @@ class ClassificationOrchestrator:
         Returns:
             Dictionary with counts by method.
         """
-        stats: dict[str, int] = {
-            "total": len(results),
+        stats = self._empty_statistics()
+        stats["total"] = len(results)
+
+        for result in results.values():
+            self._count_result(stats, result)
+
+        return stats
+
+    def _empty_statistics(self) -> dict[str, int]:
+        """Create zeroed classification statistics.
+
+        Returns:
+            Dictionary with every count set to zero.
+        """
+        return {
+            "total": 0,
             "classified": 0,
             "unclassified": 0,
             "pending": 0,
@@ -339,19 +518,25 @@ class ClassificationOrchestrator:
             "existing": 0,
         }
 
-        for result in results.values():
-            if result.classified:
-                stats["classified"] += 1
-            elif result.method == "pending":
-                stats["pending"] += 1
-            else:
-                stats["unclassified"] += 1
-
-            if result.method == "rule":
-                stats["by_rule"] += 1
-            elif result.method == "ai":
-                stats["by_ai"] += 1
-            elif result.method == "existing":
-                stats["existing"] += 1
+    def _count_result(
+        self, stats: dict[str, int], result: ClassificationResult
+    ) -> None:
+        """Add one classification result to the statistics.
 
-        return stats
+        Args:
+            stats: Statistics to update in place.
+            result: The classification result to count.
+        """
+        if result.classified:
+            stats["classified"] += 1
+        elif result.method == "pending":
+            stats["pending"] += 1
+        else:
+            stats["unclassified"] += 1
+
+        if result.method == "rule":
+            stats["by_rule"] += 1
+        elif result.method == "ai":
+            stats["by_ai"] += 1
+        elif result.method == "existing":
+            stats["existing"] += 1
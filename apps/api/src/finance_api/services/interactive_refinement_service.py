@@ -2,6 +2,7 @@
 
 import json
 import re
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 
 from anthropic import Anthropic
@@ -100,6 +101,7 @@ class InteractiveRefinementService:
         model: str = "claude-sonnet-4-5-20250514",
         temperature: float = 0.3,
         validation_service: RuleValidationService | None = None,
+        client: Anthropic | None = None,
     ) -> None:
         """Initialize the service.
 
@@ -108,8 +110,10 @@ class InteractiveRefinementService:
             model: Claude model to use for conversations.
             temperature: Temperature for LLM responses.
             validation_service: Service for validating proposed patterns.
+            client: Existing Anthropic client to reuse. If None, a new client
+                is created from api_key.
         """
-        self._client = Anthropic(api_key=api_key)
+        self._client = client or Anthropic(api_key=api_key)
         self._model = model
         self._temperature = temperature
         self._validation_service = validation_service or RuleValidationService()
@@ -293,7 +297,7 @@ class InteractiveRefinementService:
         self,
         proposals: list[ProposedRule],
         all_transactions: list[Transaction],
-        cluster_transaction_ids: set[int],
+        cluster_transaction_ids: AbstractSet[int],
     ) -> list[tuple[ProposedRule, ValidationResult]]:
         """Validate all proposals against transactions.
 
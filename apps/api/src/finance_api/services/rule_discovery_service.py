@@ -1,10 +1,11 @@
 """RuleDiscoveryService for LLM-powered rule proposal generation."""
 
+import asyncio
 import json
 from dataclasses import dataclass
 from typing import Any
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 from finance_api.models.category import Category
 from finance_api.services.high_frequency_analyzer import HighFrequencyPattern
@@ -31,6 +32,8 @@ class RuleProposalResult:
     category_name: str
     confidence: str  # high/medium/low
     reasoning: str
+    # propose_rule tool input re-encoded as JSON, or the model's text reply
+    # if it answered without the tool
     raw_response: str
 
 
@@ -61,15 +64,29 @@ Important guidelines for the regex pattern:
 - Avoid overly broad patterns that might match unrelated transactions
 - Consider common variations in how the merchant appears
 
-Respond in this exact JSON format (no other text):
-{{
-    "pattern": "(?i)merchant_pattern",
-    "category_name": "Exact category name from the list",
-    "confidence": "high|medium|low",
-    "reasoning": "Brief explanation of why this pattern and category are appropriate"
-}}
-
-JSON response:"""
+Record your proposal with the propose_rule tool, using the exact category name from the list above."""
+
+
+RULE_PROPOSAL_TOOL: dict[str, Any] = {
+    "name": "propose_rule",
+    "description": "Record a proposed transaction classification rule.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "pattern": {
+                "type": "string",
+                "description": "Python re pattern matching the transactions",
+            },
+            "category_name": {
+                "type": "string",
+                "description": "Exact category name from the provided list",
+            },
+            "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+            "reasoning": {"type": "string"},
+        },
+        "required": ["pattern", "category_name", "confidence", "reasoning"],
+    },
+}
 
 
 PATTERN_EXPLANATION_PROMPT = """You are a financial transaction analyst. A pattern has been detected that appears in many transactions from a personal bank account.
@@ -116,15 +133,7 @@ Please propose an improved rule that addresses the rejection reason. Consider:
 - Choosing a more accurate category
 - Adding word boundaries or additional constraints to the pattern
 
-Respond in this exact JSON format (no other text):
-{{
-    "pattern": "(?i)improved_pattern",
-    "category_name": "Exact category name from the list",
-    "confidence": "high|medium|low",
-    "reasoning": "Brief explanation of the improvements made"
-}}
-
-JSON response:"""
+Record your improved proposal with the propose_rule tool, using the exact category name from the list above, and explain the improvements made in the reasoning."""
 
 
 class RuleDiscoveryService:
@@ -139,6 +148,9 @@ class RuleDiscoveryService:
         api_key: str | None = None,
         model: str = "claude-opus-4-5-20251101",
         temperature: float = 0.0,
+        client: Anthropic | None = None,
+        async_client: AsyncAnthropic | None = None,
+        max_concurrency: int = 5,
     ) -> None:
         """Initialize the service.
 
@@ -146,8 +158,31 @@ class RuleDiscoveryService:
             api_key: Anthropic API key. If None, uses ANTHROPIC_API_KEY env var.
             model: Claude model to use for rule proposals.
             temperature: Temperature for LLM responses (0.0 for deterministic).
+            client: Existing Anthropic client to reuse. Sharing one client
+                between services reuses its connection pool. If None, a new
+                client is created from api_key.
+            async_client: Existing AsyncAnthropic client for the async methods.
+                If None and client is given, the async methods run client's
+                calls on worker threads; otherwise an AsyncAnthropic client is
+                created from api_key on first async call.
+            max_concurrency: Maximum concurrent requests in
+                propose_rules_batch_async. Must be at least 1.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        self._client = Anthropic(api_key=api_key)
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+
+        self._api_key = api_key
+        self._client = client or Anthropic(api_key=api_key)
+        self._async_client = async_client
+        # An injected client must also serve the async methods, rather than a
+        # separate client built from api_key
+        self._client_injected = client is not None
+        self._max_concurrency = max_concurrency
         self._model = model
         self._temperature = temperature
 
@@ -192,16 +227,14 @@ class RuleDiscoveryService:
         Raises:
             RuleDiscoveryError: If response is not valid JSON.
         """
-        text = response_text.strip()
-
         # Handle potential markdown code blocks
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
+        text = (
+            response_text.strip()
+            .removeprefix("```json")
+            .removeprefix("```")
+            .removesuffix("```")
+            .strip()
+        )
 
         try:
             return json.loads(text)  # type: ignore[no-any-return]
@@ -230,40 +263,134 @@ class RuleDiscoveryService:
                 "Must be high, medium, or low."
             )
 
-    def propose_rule(
-        self,
-        cluster: TransactionCluster,
-        categories: list[Category],
-    ) -> RuleProposalResult:
-        """Propose a classification rule for a transaction cluster.
+    def _rule_proposal_params(self, prompt: str) -> dict[str, Any]:
+        """Build messages.create arguments for a rule proposal prompt.
+
+        The model is asked to answer through the propose_rule tool, whose input
+        arrives already parsed.
 
         Args:
-            cluster: The transaction cluster to create a rule for.
-            categories: List of available categories.
+            prompt: The formatted proposal or refinement prompt.
 
         Returns:
-            RuleProposalResult with the proposed pattern and category.
+            Keyword arguments for messages.create.
+        """
+        return {
+            "model": self._model,
+            "max_tokens": 1024,
+            "temperature": self._temperature,
+            "tools": [RULE_PROPOSAL_TOOL],
+            "tool_choice": {"type": "tool", "name": RULE_PROPOSAL_TOOL["name"]},
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _read_rule_proposal(self, response: Any) -> tuple[dict[str, Any] | None, str]:
+        """Read the proposed rule from an API response.
 
-        Raises:
-            RuleDiscoveryError: If rule proposal fails.
+        Args:
+            response: Response returned by messages.create.
+
+        Returns:
+            Tuple of (tool input, raw response). The raw response is the tool
+            input re-encoded as JSON, or the model's text reply when it
+            answered without the tool; the tool input is then None and the
+            text must be parsed.
         """
-        prompt = RULE_PROPOSAL_PROMPT.format(
-            sample_descriptions=self._format_samples(cluster.sample_descriptions),
-            category_list=self._format_categories(categories),
-        )
+        for block in response.content:
+            if getattr(block, "type", None) == "tool_use":
+                data = dict(block.input)
+                return (data, json.dumps(data))
+        return (None, response.content[0].text)
+
+    def _request_rule_proposal(self, prompt: str) -> tuple[dict[str, Any], str]:
+        """Send a rule proposal prompt and return the proposed rule fields.
 
+        Args:
+            prompt: The formatted proposal or refinement prompt.
+
+        Returns:
+            Tuple of (parsed data, raw response from _read_rule_proposal).
+
+        Raises:
+            RuleDiscoveryError: If the API call fails or the response is invalid.
+        """
         try:
             response = self._client.messages.create(
-                model=self._model,
-                max_tokens=1024,
-                temperature=self._temperature,
-                messages=[{"role": "user", "content": prompt}],
+                **self._rule_proposal_params(prompt)
             )
-            response_text = response.content[0].text  # type: ignore[union-attr]
+            data, response_text = self._read_rule_proposal(response)
         except Exception as e:
             raise RuleDiscoveryError(f"LLM API call failed: {e}") from e
 
-        data = self._parse_response(response_text)
+        if data is None:
+            data = self._parse_response(response_text)
+        return (data, response_text)
+
+    async def _request_rule_proposal_async(
+        self, prompt: str
+    ) -> tuple[dict[str, Any], str]:
+        """Async version of _request_rule_proposal.
+
+        Args:
+            prompt: The formatted proposal or refinement prompt.
+
+        Returns:
+            Tuple of (parsed data, raw response from _read_rule_proposal).
+
+        Raises:
+            RuleDiscoveryError: If the API call fails or the response is invalid.
+        """
+        params = self._rule_proposal_params(prompt)
+        if self._async_client is None and not self._client_injected:
+            self._async_client = AsyncAnthropic(api_key=self._api_key)
+
+        try:
+            if self._async_client is None:
+                response = await asyncio.to_thread(
+                    lambda: self._client.messages.create(**params)
+                )
+            else:
+                response = await self._async_client.messages.create(**params)
+            data, response_text = self._read_rule_proposal(response)
+        except Exception as e:
+            raise RuleDiscoveryError(f"LLM API call failed: {e}") from e
+
+        if data is None:
+            data = self._parse_response(response_text)
+        return (data, response_text)
+
+    def _build_proposal_prompt(
+        self, cluster: TransactionCluster, categories: list[Category]
+    ) -> str:
+        """Format the rule proposal prompt for a cluster.
+
+        Args:
+            cluster: The transaction cluster to create a rule for.
+            categories: List of available categories.
+
+        Returns:
+            The formatted prompt.
+        """
+        return RULE_PROPOSAL_PROMPT.format(
+            sample_descriptions=self._format_samples(cluster.sample_descriptions),
+            category_list=self._format_categories(categories),
+        )
+
+    def _to_proposal_result(
+        self, data: dict[str, Any], response_text: str
+    ) -> RuleProposalResult:
+        """Validate proposed rule fields and wrap them in a result.
+
+        Args:
+            data: Parsed rule fields.
+            response_text: Raw response from _read_rule_proposal.
+
+        Returns:
+            RuleProposalResult built from the fields.
+
+        Raises:
+            RuleDiscoveryError: If required fields are missing or invalid.
+        """
         self._validate_response(data)
 
         return RuleProposalResult(
@@ -274,6 +401,48 @@ class RuleDiscoveryService:
             raw_response=response_text,
         )
 
+    def propose_rule(
+        self,
+        cluster: TransactionCluster,
+        categories: list[Category],
+    ) -> RuleProposalResult:
+        """Propose a classification rule for a transaction cluster.
+
+        Args:
+            cluster: The transaction cluster to create a rule for.
+            categories: List of available categories.
+
+        Returns:
+            RuleProposalResult with the proposed pattern and category.
+
+        Raises:
+            RuleDiscoveryError: If rule proposal fails.
+        """
+        prompt = self._build_proposal_prompt(cluster, categories)
+        data, response_text = self._request_rule_proposal(prompt)
+        return self._to_proposal_result(data, response_text)
+
+    async def propose_rule_async(
+        self,
+        cluster: TransactionCluster,
+        categories: list[Category],
+    ) -> RuleProposalResult:
+        """Async version of propose_rule.
+
+        Args:
+            cluster: The transaction cluster to create a rule for.
+            categories: List of available categories.
+
+        Returns:
+            RuleProposalResult with the proposed pattern and category.
+
+        Raises:
+            RuleDiscoveryError: If rule proposal fails.
+        """
+        prompt = self._build_proposal_prompt(cluster, categories)
+        data, response_text = await self._request_rule_proposal_async(prompt)
+        return self._to_proposal_result(data, response_text)
+
     def refine_rule(
         self,
         cluster: TransactionCluster,
@@ -305,27 +474,8 @@ class RuleDiscoveryService:
             category_list=self._format_categories(categories),
         )
 
-        try:
-            response = self._client.messages.create(
-                model=self._model,
-                max_tokens=1024,
-                temperature=self._temperature,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            response_text = response.content[0].text  # type: ignore[union-attr]
-        except Exception as e:
-            raise RuleDiscoveryError(f"LLM API call failed: {e}") from e
-
-        data = self._parse_response(response_text)
-        self._validate_response(data)
-
-        return RuleProposalResult(
-            pattern=str(data["pattern"]),
-            category_name=str(data["category_name"]),
-            confidence=str(data["confidence"]),
-            reasoning=str(data["reasoning"]),
-            raw_response=response_text,
-        )
+        data, response_text = self._request_rule_proposal(prompt)
+        return self._to_proposal_result(data, response_text)
 
     def propose_rules_batch(
         self,
@@ -349,6 +499,36 @@ class RuleDiscoveryService:
                 results.append(e)
         return results
 
+    async def propose_rules_batch_async(
+        self,
+        clusters: list[TransactionCluster],
+        categories: list[Category],
+    ) -> list[RuleProposalResult | RuleDiscoveryError]:
+        """Propose rules for multiple clusters concurrently.
+
+        At most max_concurrency requests are in flight at once.
+
+        Args:
+            clusters: List of transaction clusters.
+            categories: List of available categories.
+
+        Returns:
+            List of RuleProposalResult or RuleDiscoveryError for each cluster,
+            in the same order as clusters.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def propose(
+            cluster: TransactionCluster,
+        ) -> RuleProposalResult | RuleDiscoveryError:
+            async with semaphore:
+                try:
+                    return await self.propose_rule_async(cluster, categories)
+                except RuleDiscoveryError as e:
+                    return e
+
+        return list(await asyncio.gather(*(propose(c) for c in clusters)))
+
     def explain_pattern(
         self,
         pattern: HighFrequencyPattern,
@@ -1,14 +1,60 @@
 """RuleValidationService for testing proposed rules before approval."""
 
 import re
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
 from decimal import Decimal
+from functools import lru_cache
 
 from finance_api.models.classification_rule import ClassificationRule
 from finance_api.models.transaction import Transaction
 from finance_api.repositories.classification_rule_repository import (
     ClassificationRuleRepository,
 )
+from finance_api.services.rules_classification_service import (
+    extract_literal_alternatives,
+)
+
+# Extracts the pattern from rule expressions like: description =~ "(?i)pattern"
+_EXPRESSION_PATTERN_RE = re.compile(r'=~\s*"([^"]+)"')
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: str) -> tuple[re.Pattern[str] | None, str | None]:
+    """Compile a regex pattern, caching the result by pattern string.
+
+    Proposed and existing rule patterns are validated repeatedly during
+    discovery, so each one is only compiled once.
+
+    Args:
+        pattern: The regex pattern to compile.
+
+    Returns:
+        Tuple of (compiled_pattern, error_message); exactly one is None.
+    """
+    try:
+        return (re.compile(pattern), None)
+    except re.error as e:
+        return (None, str(e))
+
+
+def _ratio(numerator: int, denominator: int) -> Decimal:
+    """Divide two counts, rounded half-even to four decimal places.
+
+    Uses integer arithmetic and builds a single Decimal for the result, which
+    matches Decimal division followed by quantize(Decimal("0.0001")).
+
+    Args:
+        numerator: Dividend count.
+        denominator: Divisor count (must be positive).
+
+    Returns:
+        The ratio as a Decimal with four decimal places.
+    """
+    quotient, remainder = divmod(numerator * 10000, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+        quotient += 1
+    return Decimal(quotient).scaleb(-4)
 
 
 @dataclass
@@ -68,17 +114,14 @@ class RuleValidationService:
         Returns:
             Tuple of (is_valid, error_message).
         """
-        try:
-            re.compile(pattern)
-            return (True, None)
-        except re.error as e:
-            return (False, str(e))
+        compiled, error = _compile(pattern)
+        return (compiled is not None, error)
 
     def test_rule(
         self,
         pattern: str,
         all_transactions: list[Transaction],
-        cluster_transaction_ids: set[int],
+        cluster_transaction_ids: AbstractSet[int],
     ) -> ValidationResult:
         """Test a proposed rule against all transactions.
 
@@ -91,8 +134,8 @@ class RuleValidationService:
             ValidationResult with precision metrics and samples.
         """
         # First validate the regex
-        is_valid, error = self.validate_regex(pattern)
-        if not is_valid:
+        compiled, error = _compile(pattern)
+        if compiled is None:
             return ValidationResult(
                 pattern=pattern,
                 total_matches=0,
@@ -104,30 +147,30 @@ class RuleValidationService:
                 regex_error=error,
             )
 
-        try:
-            compiled = re.compile(pattern)
-        except re.error as e:
-            return ValidationResult(
-                pattern=pattern,
-                total_matches=0,
-                true_positives=0,
-                false_positives=0,
-                precision=Decimal("0"),
-                coverage=Decimal("0"),
-                is_valid_regex=False,
-                regex_error=str(e),
-            )
-
         # Test against all transactions
         true_positives: list[Transaction] = []
         false_positives: list[Transaction] = []
 
+        search = compiled.search
+        in_cluster = cluster_transaction_ids.__contains__
+        literals = extract_literal_alternatives(pattern)
+
         for txn in all_transactions:
-            if not txn.description:
+            description = txn.description
+            if not description:
                 continue
 
-            if compiled.search(txn.description):
-                if txn.id in cluster_transaction_ids:
+            # Plain-text patterns are checked by substring on ASCII descriptions,
+            # where lowercasing agrees with regex case folding
+            if literals is not None and description.isascii():
+                alternatives, ignore_case = literals
+                haystack = description.lower() if ignore_case else description
+                matched = any(alt in haystack for alt in alternatives)
+            else:
+                matched = search(description) is not None
+
+            if matched:
+                if in_cluster(txn.id):
                     true_positives.append(txn)
                 else:
                     false_positives.append(txn)
@@ -137,12 +180,12 @@ class RuleValidationService:
 
         # Calculate metrics
         precision = (
-            Decimal(len(true_positives)) / Decimal(total_matches)
+            _ratio(len(true_positives), total_matches)
             if total_matches > 0
             else Decimal("0")
         )
         coverage = (
-            Decimal(len(true_positives)) / Decimal(cluster_size)
+            _ratio(len(true_positives), cluster_size)
             if cluster_size > 0
             else Decimal("0")
         )
@@ -160,8 +203,8 @@ class RuleValidationService:
             total_matches=total_matches,
             true_positives=len(true_positives),
             false_positives=len(false_positives),
-            precision=precision.quantize(Decimal("0.0001")),
-            coverage=coverage.quantize(Decimal("0.0001")),
+            precision=precision,
+            coverage=coverage,
             sample_true_positives=sample_tp,
             sample_false_positives=sample_fp,
         )
@@ -179,7 +222,7 @@ class RuleValidationService:
         total = true_positives + false_positives
         if total == 0:
             return Decimal("0")
-        return (Decimal(true_positives) / Decimal(total)).quantize(Decimal("0.0001"))
+        return _ratio(true_positives, total)
 
     def calculate_recall(self, true_positives: int, cluster_size: int) -> Decimal:
         """Calculate recall (coverage) from TP and cluster size.
@@ -193,15 +236,13 @@ class RuleValidationService:
         """
         if cluster_size == 0:
             return Decimal("0")
-        return (Decimal(true_positives) / Decimal(cluster_size)).quantize(
-            Decimal("0.0001")
-        )
+        return _ratio(true_positives, cluster_size)
 
     def sample_false_positives(
         self,
         pattern: str,
         all_transactions: list[Transaction],
-        cluster_transaction_ids: set[int],
+        cluster_transaction_ids: AbstractSet[int],
         max_samples: int | None = None,
     ) -> list[str]:
         """Get sample false positive descriptions for review.
@@ -218,9 +259,8 @@ class RuleValidationService:
         if max_samples is None:
             max_samples = self._max_samples
 
-        try:
-            compiled = re.compile(pattern)
-        except re.error:
+        compiled, _ = _compile(pattern)
+        if compiled is None:
             return []
 
         samples: list[str] = []
@@ -254,19 +294,20 @@ class RuleValidationService:
         if self._rule_repository is None:
             return ConflictResult(has_conflicts=False)
 
-        try:
-            new_compiled = re.compile(pattern)
-        except re.error:
+        new_compiled, _ = _compile(pattern)
+        if new_compiled is None:
             return ConflictResult(has_conflicts=False)
 
         # Get all active rules
         existing_rules = self._rule_repository.get_active_by_priority()
 
-        # Find transactions that match the new pattern
-        new_matches: set[int] = set()
-        for txn in all_transactions:
-            if txn.description and new_compiled.search(txn.description):
-                new_matches.add(txn.id)
+        # Descriptions of transactions that match the new pattern; only these
+        # need checking against each existing rule
+        new_matches: list[str] = [
+            txn.description
+            for txn in all_transactions
+            if txn.description and new_compiled.search(txn.description)
+        ]
 
         if not new_matches:
             return ConflictResult(has_conflicts=False)
@@ -282,17 +323,13 @@ class RuleValidationService:
             if not rule_pattern:
                 continue
 
-            try:
-                rule_compiled = re.compile(rule_pattern)
-            except re.error:
+            rule_compiled, _ = _compile(rule_pattern)
+            if rule_compiled is None:
                 continue
 
             # Count overlapping transactions
-            overlap_count = 0
-            for txn in all_transactions:
-                if txn.id in new_matches and txn.description:
-                    if rule_compiled.search(txn.description):
-                        overlap_count += 1
+            search = rule_compiled.search
+            overlap_count = sum(1 for desc in new_matches if search(desc))
 
             if overlap_count > 0:
                 conflicting.append(rule)
@@ -315,11 +352,8 @@ class RuleValidationService:
         Returns:
             The extracted pattern or None if not found.
         """
-        # Match patterns like: description =~ "(?i)pattern"
-        match = re.search(r'=~\s*"([^"]+)"', expression)
-        if match:
-            return match.group(1)
-        return None
+        match = _EXPRESSION_PATTERN_RE.search(expression)
+        return match.group(1) if match else None
 
     def test_pattern_matches(self, pattern: str, description: str) -> bool:
         """Test if a pattern matches a specific description.
@@ -331,7 +365,5 @@ class RuleValidationService:
         Returns:
             True if pattern matches, False otherwise.
         """
-        try:
-            return bool(re.search(pattern, description))
-        except re.error:
-            return False
+        compiled, _ = _compile(pattern)
+        return compiled is not None and bool(compiled.search(description))
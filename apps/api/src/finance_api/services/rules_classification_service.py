@@ -1,7 +1,10 @@
 """RulesClassificationService for deterministic transaction classification."""
 
 import logging
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import rule_engine  # type: ignore[import-untyped]
@@ -14,6 +17,38 @@ from finance_api.repositories.classification_rule_repository import (
 
 logger = logging.getLogger(__name__)
 
+# A regex alternative made only of characters that are literal in Python re
+_LITERAL_ALTERNATIVE_RE = re.compile(r"[A-Za-z0-9 &'-]+")
+
+
+@lru_cache(maxsize=1024)
+def extract_literal_alternatives(pattern: str) -> tuple[tuple[str, ...], bool] | None:
+    """Extract the literal alternatives of a simple regex pattern.
+
+    Only patterns such as `(?i)tesco` or `(?i)(tesco|asda)` qualify, where
+    every alternative is plain text. Both the classification pre-filter and
+    rule validation use this, so they agree on which patterns are literal.
+
+    Args:
+        pattern: The regex pattern.
+
+    Returns:
+        Tuple of (alternatives, ignore_case), or None if the pattern is not a
+        literal alternation. Alternatives are lowercased when ignore_case is set.
+    """
+    ignore_case = pattern.startswith("(?i)")
+    body = pattern[4:] if ignore_case else pattern
+    if body.startswith("(") and body.endswith(")") and not body.startswith("(?"):
+        body = body[1:-1]
+
+    alternatives = body.split("|")
+    if not all(_LITERAL_ALTERNATIVE_RE.fullmatch(alt) for alt in alternatives):
+        return None
+
+    if ignore_case:
+        return (tuple(alt.lower() for alt in alternatives), True)
+    return (tuple(alternatives), False)
+
 
 @dataclass
 class RuleMatch:
@@ -24,6 +59,31 @@ class RuleMatch:
     requires_disambiguation: bool
 
 
+@dataclass(slots=True)
+class _CompiledRule:
+    """A classification rule compiled for evaluation.
+
+    anchors holds literal strings of which at least one must appear in the
+    description for the rule to match (at the start when anchored is set).
+    None means no pre-filter applies. When exact is set the anchor check alone
+    decides the rule and rule-engine is not consulted.
+
+    matcher is set for rules that are a single description regex comparison.
+    It is the bound match or search method of the compiled pattern and is
+    called on the description directly instead of evaluating the rule.
+
+    Slotted, since the match loop reads these fields for every rule it visits.
+    """
+
+    rule: ClassificationRule
+    compiled: rule_engine.Rule
+    anchors: tuple[str, ...] | None = None
+    ignore_case: bool = False
+    anchored: bool = False
+    exact: bool = False
+    matcher: Callable[[str], re.Match[str] | None] | None = None
+
+
 class RulesClassificationService:
     """Service for classifying transactions using deterministic rules.
 
@@ -39,9 +99,7 @@ class RulesClassificationService:
             rule_repository: Repository for accessing classification rules.
         """
         self._rule_repository = rule_repository
-        self._compiled_rules: (
-            list[tuple[ClassificationRule, rule_engine.Rule]] | None
-        ) = None
+        self._compiled_rules: list[_CompiledRule] | None = None
         self._context = self._create_context()
 
     def _create_context(self) -> rule_engine.Context:
@@ -64,23 +122,53 @@ class RulesClassificationService:
             )
         )
 
-    def _load_and_compile_rules(
-        self,
-    ) -> list[tuple[ClassificationRule, rule_engine.Rule]]:
+    def _required_description_comparison(
+        self, expression: rule_engine.ast.ExpressionBase
+    ) -> rule_engine.ast.FuzzyComparisonExpression | None:
+        """Find a regex comparison the description must satisfy.
+
+        Handles `description =~ "..."` and `description =~~ "..."` comparisons,
+        including when they are one side of an `and`.
+
+        Args:
+            expression: Root of a compiled rule's expression tree.
+
+        Returns:
+            The comparison node, or None if no such requirement was found.
+        """
+        if isinstance(expression, rule_engine.ast.LogicExpression):
+            if expression.type != "and":
+                return None
+            return self._required_description_comparison(
+                expression.left
+            ) or self._required_description_comparison(expression.right)
+
+        if (
+            isinstance(expression, rule_engine.ast.FuzzyComparisonExpression)
+            and expression.type in ("eq_fzm", "eq_fzs")
+            and isinstance(expression.left, rule_engine.ast.SymbolExpression)
+            and expression.left.name == "description"
+            and expression.left.scope is None
+            and isinstance(expression.right, rule_engine.ast.StringExpression)
+        ):
+            return expression
+
+        return None
+
+    def _load_and_compile_rules(self) -> list[_CompiledRule]:
         """Load rules from repository and compile them.
 
         Returns:
-            List of tuples containing (ClassificationRule, compiled rule_engine.Rule).
+            List of compiled rules in priority order.
         """
         db_rules = self._rule_repository.get_active_by_priority()
-        compiled: list[tuple[ClassificationRule, rule_engine.Rule]] = []
+        compiled: list[_CompiledRule] = []
 
         for db_rule in db_rules:
             try:
                 compiled_rule = rule_engine.Rule(
                     db_rule.rule_expression, context=self._context
                 )
-                compiled.append((db_rule, compiled_rule))
             except rule_engine.RuleSyntaxError as e:
                 # Log error but continue with other rules
                 logger.warning(
@@ -89,6 +177,25 @@ class RulesClassificationService:
                     db_rule.id,
                     e,
                 )
+                continue
+
+            entry = _CompiledRule(rule=db_rule, compiled=compiled_rule)
+            root = compiled_rule.statement.expression
+            comparison = self._required_description_comparison(root)
+            if comparison is not None:
+                pattern = str(comparison.right.value)
+                literals = extract_literal_alternatives(pattern)
+                if literals is not None:
+                    entry.anchors, entry.ignore_case = literals
+                    # =~ uses re.match, so the literal must start the description
+                    entry.anchored = comparison.type == "eq_fzm"
+                    entry.exact = comparison is root
+                if comparison is root:
+                    regex = re.compile(pattern, self._context.regex_flags)
+                    entry.matcher = (
+                        regex.match if comparison.type == "eq_fzm" else regex.search
+                    )
+            compiled.append(entry)
 
         return compiled
 
@@ -103,7 +210,7 @@ class RulesClassificationService:
         self._compiled_rules = self._load_and_compile_rules()
         return len(self._compiled_rules)
 
-    def _ensure_rules_loaded(self) -> list[tuple[ClassificationRule, rule_engine.Rule]]:
+    def _ensure_rules_loaded(self) -> list[_CompiledRule]:
         """Ensure rules are loaded, loading them if necessary.
 
         Returns:
@@ -113,71 +220,159 @@ class RulesClassificationService:
             self._compiled_rules = self._load_and_compile_rules()
         return self._compiled_rules
 
-    def _transaction_to_context(self, transaction: Transaction) -> dict[str, Any]:
+    def _transaction_to_context(
+        self,
+        transaction: Transaction,
+        context_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """Convert a Transaction to a rule-engine evaluation context.
 
         Args:
             transaction: The transaction to convert.
+            context_data: Optional dictionary to refill in place. Batch callers
+                pass the same dictionary for every transaction so no new
+                context is allocated per row.
 
         Returns:
             Dictionary suitable for rule-engine evaluation.
         """
-        return {
-            "description": transaction.description or "",
-            "amount": float(transaction.amount) if transaction.amount else 0.0,
-            "currency": transaction.currency or "GBP",
-            "account_name": transaction.account_name or "",
-            "external_id": transaction.external_id or "",
-            "notes": transaction.notes or "",
-            "transaction_date": (
-                transaction.transaction_date.isoformat()
-                if transaction.transaction_date
-                else ""
-            ),
-        }
-
-    def classify(self, transaction: Transaction) -> RuleMatch | None:
-        """Classify a transaction using rules.
+        if context_data is None:
+            context_data = {}
+        amount = transaction.amount
+        transaction_date = transaction.transaction_date
+        context_data["description"] = transaction.description or ""
+        context_data["amount"] = float(amount) if amount else 0.0
+        context_data["currency"] = transaction.currency or "GBP"
+        context_data["account_name"] = transaction.account_name or ""
+        context_data["external_id"] = transaction.external_id or ""
+        context_data["notes"] = transaction.notes or ""
+        context_data["transaction_date"] = (
+            transaction_date.isoformat() if transaction_date else ""
+        )
+        return context_data
 
-        Evaluates all active rules in priority order. Returns the first match.
+    def _match_transaction(
+        self,
+        compiled_rules: list[_CompiledRule],
+        transaction: Transaction,
+        context_data: dict[str, Any] | None = None,
+    ) -> RuleMatch | None:
+        """Evaluate compiled rules against a transaction and return the first match.
+
+        Rules with literal anchors are skipped without invoking rule-engine when
+        none of their anchors occur in the description, and rules that consist
+        solely of such a comparison are decided by the anchor check alone. The
+        check is only used for ASCII descriptions, where lowercasing agrees with
+        regex case folding. Other single-comparison rules run their regex on the
+        description directly. The rule-engine context is only built once a rule
+        needs full evaluation.
 
         Args:
+            compiled_rules: Compiled rules in priority order.
             transaction: The transaction to classify.
+            context_data: Optional dictionary to refill as the evaluation
+                context, see _transaction_to_context().
 
         Returns:
-            RuleMatch if a rule matched, None if no rules matched.
+            RuleMatch for the first matching rule, None if no rules matched.
         """
-        compiled_rules = self._ensure_rules_loaded()
-        context_data = self._transaction_to_context(transaction)
-
-        for db_rule, compiled_rule in compiled_rules:
+        description = transaction.description or ""
+        prefilter = description.isascii()
+        lowered = description.lower() if prefilter else description
+        context_ready = False
+
+        for entry in compiled_rules:
+            if prefilter and entry.anchors is not None:
+                haystack = lowered if entry.ignore_case else description
+                if entry.anchored:
+                    hit = haystack.startswith(entry.anchors)
+                else:
+                    hit = any(anchor in haystack for anchor in entry.anchors)
+                if not hit:
+                    continue
+                if entry.exact:
+                    return self._to_match(entry.rule)
+            if entry.matcher is not None:
+                if entry.matcher(description):
+                    return self._to_match(entry.rule)
+                continue
+            if not context_ready:
+                context_data = self._transaction_to_context(transaction, context_data)
+                context_ready = True
             try:
-                if compiled_rule.matches(context_data):
-                    return RuleMatch(
-                        rule=db_rule,
-                        category_id=db_rule.category_id,
-                        requires_disambiguation=db_rule.requires_disambiguation,
-                    )
+                if entry.compiled.matches(context_data):
+                    return self._to_match(entry.rule)
             except rule_engine.EngineError:
                 # Evaluation error - skip this rule and continue
                 continue
 
         return None
 
+    def _to_match(self, db_rule: ClassificationRule) -> RuleMatch:
+        """Build a RuleMatch for a matched rule.
+
+        Args:
+            db_rule: The rule that matched.
+
+        Returns:
+            RuleMatch for the rule.
+        """
+        return RuleMatch(
+            rule=db_rule,
+            category_id=db_rule.category_id,
+            requires_disambiguation=db_rule.requires_disambiguation,
+        )
+
+    def classify(self, transaction: Transaction) -> RuleMatch | None:
+        """Classify a transaction using rules.
+
+        Evaluates all active rules in priority order. Returns the first match.
+
+        Args:
+            transaction: The transaction to classify.
+
+        Returns:
+            RuleMatch if a rule matched, None if no rules matched.
+        """
+        compiled_rules = self._ensure_rules_loaded()
+        return self._match_transaction(compiled_rules, transaction)
+
     def classify_batch(
         self, transactions: list[Transaction]
     ) -> dict[int, RuleMatch | None]:
         """Classify multiple transactions.
 
+        Rules are resolved once for the whole batch and a single evaluation
+        context is refilled for each transaction that needs one. When every
+        rule is a single description comparison, the outcome depends on the
+        description alone, so each distinct description is matched once.
+
         Args:
             transactions: List of transactions to classify.
 
         Returns:
             Dictionary mapping transaction ID to RuleMatch (or None if no match).
         """
+        compiled_rules = self._ensure_rules_loaded()
         results: dict[int, RuleMatch | None] = {}
+
+        if all(entry.matcher is not None for entry in compiled_rules):
+            matches: dict[str, RuleMatch | None] = {}
+            for transaction in transactions:
+                description = transaction.description or ""
+                if description in matches:
+                    match = matches[description]
+                else:
+                    match = self._match_transaction(compiled_rules, transaction)
+                    matches[description] = match
+                results[transaction.id] = match
+            return results
+
+        context_data: dict[str, Any] = {}
         for transaction in transactions:
-            results[transaction.id] = self.classify(transaction)
+            results[transaction.id] = self._match_transaction(
+                compiled_rules, transaction, context_data
+            )
         return results
 
     def test_rule_expression(
@@ -220,11 +415,11 @@ class RulesClassificationService:
         context_data = self._transaction_to_context(transaction)
         results: list[tuple[ClassificationRule, bool]] = []
 
-        for db_rule, compiled_rule in compiled_rules:
+        for entry in compiled_rules:
             try:
-                matched = compiled_rule.matches(context_data)
-                results.append((db_rule, matched))
+                matched = entry.compiled.matches(context_data)
+                results.append((entry.rule, matched))
             except rule_engine.EngineError:
-                results.append((db_rule, False))
+                results.append((entry.rule, False))
 
         return results
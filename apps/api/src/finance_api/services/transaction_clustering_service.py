@@ -1,11 +1,34 @@
 """TransactionClusteringService for grouping similar transactions."""
 
 import hashlib
+import os
 import re
+import string
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
 
 from finance_api.models.transaction import Transaction
 
+# str.translate() table equivalent to REMOVAL_PATTERNS for ASCII text
+_ASCII_REMOVAL_TABLE = str.maketrans(dict.fromkeys("0123456789*#@.", " "))
+
+# As above, also uppercasing, so ASCII text is normalized in a single pass
+_ASCII_UPPER_REMOVAL_TABLE = str.maketrans(
+    {
+        **dict(zip(string.ascii_lowercase, string.ascii_uppercase, strict=True)),
+        **dict.fromkeys("0123456789*#@.", " "),
+    }
+)
+
+# RE2 pattern equivalent to REMOVAL_PATTERNS for ASCII text
+_ASCII_REMOVAL_RE2 = r"[0-9*#@.]+"
+
 
 @dataclass
 class TransactionCluster:
@@ -16,6 +39,15 @@ class TransactionCluster:
     transactions: list[Transaction] = field(default_factory=list)
     sample_descriptions: list[str] = field(default_factory=list)
 
+    @cached_property
+    def transaction_ids(self) -> frozenset[int]:
+        """Return the IDs of the cluster's transactions, for membership checks.
+
+        Built on first access and cached, since clusters aren't changed once
+        cluster_transactions() has produced them.
+        """
+        return frozenset(t.id for t in self.transactions)
+
     @property
     def size(self) -> int:
         """Return the number of transactions in the cluster."""
@@ -69,13 +101,27 @@ class TransactionClusteringService:
         ]
     )
 
-    # Patterns to remove during normalization
+    # Patterns to remove during normalization. Runs of whitespace are
+    # collapsed separately when the description is re-joined.
     REMOVAL_PATTERNS = [
         r"\d+",  # Numbers (store IDs, reference numbers)
         r"[*#@.]",  # Special characters including dots
-        r"\s{2,}",  # Multiple spaces
     ]
 
+    # Compiled once for the class, since a service is created per request
+    _REMOVAL_RE = re.compile("|".join(REMOVAL_PATTERNS))
+
+    # Words the Arrow path drops; its split keeps empty leading/trailing words
+    _INSIGNIFICANT_WORDS = pa.array(["", *sorted(REMOVABLE_SUFFIXES)])
+
+    # Minimum number of new descriptions in a batch for key extraction to be
+    # vectorized with Arrow compute kernels
+    VECTORIZE_THRESHOLD = 1000
+
+    # Descriptions per Arrow batch. Arrow kernels release the GIL, so several
+    # batches are processed on a thread pool.
+    VECTORIZE_CHUNK_SIZE = 50_000
+
     def __init__(
         self,
         min_cluster_size: int = 2,
@@ -93,8 +139,9 @@ class TransactionClusteringService:
         """
         self._min_cluster_size = min_cluster_size
         self._max_samples = max_samples
-        self._compiled_patterns = [re.compile(p) for p in self.REMOVAL_PATTERNS]
         self._strip_patterns = strip_patterns or []
+        self._key_cache: dict[str, str] = {}
+        self._hash_cache: dict[str, str] = {}
 
     def normalize_description(self, description: str) -> str:
         """Normalize a transaction description for clustering.
@@ -112,32 +159,86 @@ class TransactionClusteringService:
         Returns:
             Normalized description string.
         """
-        # Step 1: Uppercase
-        normalized = description.upper()
+        if self._strip_patterns:
+            # Step 1: Uppercase
+            normalized = description.upper()
 
-        # Step 2: Remove strip patterns (case-insensitive, already uppercase)
-        for strip_pattern in self._strip_patterns:
-            # Strip patterns are already uppercase from Stage 1 detection
-            normalized = normalized.replace(strip_pattern.upper(), " ")
+            # Step 2: Remove strip patterns (case-insensitive, already uppercase)
+            for strip_pattern in self._strip_patterns:
+                # Strip patterns are already uppercase from Stage 1 detection
+                normalized = normalized.replace(strip_pattern.upper(), " ")
+
+            # Step 3: Remove numbers and special chars
+            normalized = self._remove_numbers_and_specials(normalized)
+        else:
+            # Steps 1 and 3 together when there is nothing to strip in between
+            normalized = self._uppercase_and_remove(description)
+
+        # Steps 4 and 5: Split on whitespace once, drop suffixes and re-join
+        suffixes = self.REMOVABLE_SUFFIXES
+        return " ".join([w for w in normalized.split() if w not in suffixes])
 
-        # Step 3: Remove regex patterns (numbers, special chars)
-        for pattern in self._compiled_patterns:
-            normalized = pattern.sub(" ", normalized)
+    def _remove_numbers_and_specials(self, text: str) -> str:
+        """Replace REMOVAL_PATTERNS matches in text with spaces.
 
-        # Step 4: Clean whitespace
-        normalized = " ".join(normalized.split())
+        A translation table does this without the regex engine for ASCII text;
+        \\d also matches other Unicode digits, so everything else goes through
+        the regex.
 
-        # Step 5: Remove suffixes
-        words = normalized.split()
-        filtered_words = [w for w in words if w not in self.REMOVABLE_SUFFIXES]
+        Args:
+            text: Uppercased description text.
+
+        Returns:
+            Text with numbers and special characters replaced by spaces.
+        """
+        if text.isascii():
+            return text.translate(_ASCII_REMOVAL_TABLE)
+        return self._REMOVAL_RE.sub(" ", text)
+
+    def _uppercase_and_remove(self, text: str) -> str:
+        """Uppercase text and replace REMOVAL_PATTERNS matches with spaces.
+
+        ASCII text is handled by one translation table in a single pass.
+
+        Args:
+            text: Raw description text.
+
+        Returns:
+            Uppercased text with numbers and special characters replaced.
+        """
+        if text.isascii():
+            return text.translate(_ASCII_UPPER_REMOVAL_TABLE)
+        return self._REMOVAL_RE.sub(" ", text.upper())
 
-        return " ".join(filtered_words).strip()
+    def _first_significant_word(self, description: str) -> str | None:
+        """Find the cluster key by normalizing only the first raw token.
+
+        Normalization never joins whitespace-separated tokens, so when there
+        are no strip patterns the key is the first significant word of the
+        first token that has one. Only the first token is examined here.
+
+        Args:
+            description: Raw transaction description.
+
+        Returns:
+            The cluster key, or None if the first token holds no significant
+            word and full normalization is needed.
+        """
+        head = description.split(None, 1)
+        if not head:
+            return None
+        for word in self._uppercase_and_remove(head[0]).split():
+            if word not in self.REMOVABLE_SUFFIXES:
+                return word
+        return None
 
     def extract_cluster_key(self, description: str) -> str:
         """Extract the cluster key from a description.
 
         Takes the first significant token after normalization as the key.
-        This provides fast, deterministic clustering.
+        This provides fast, deterministic clustering. Keys are cached per
+        description, since bank feeds repeat the same descriptions heavily,
+        and usually only the leading token needs to be normalized.
 
         Args:
             description: Raw transaction description.
@@ -145,62 +246,174 @@ class TransactionClusteringService:
         Returns:
             Cluster key string.
         """
-        normalized = self.normalize_description(description)
-        words = normalized.split()
+        key = self._key_cache.get(description)
+        if key is not None:
+            return key
+
+        # Strip patterns can span tokens, so they need the full pipeline
+        if not self._strip_patterns:
+            key = self._first_significant_word(description)
+
+        if key is None:
+            # Return first word as cluster key
+            # This handles most merchant names well. Normalized descriptions
+            # are single-space separated, so partition() finds it without
+            # building a list of every word.
+            first, _, _ = self.normalize_description(description).partition(" ")
+            key = first or "UNCLUSTERED"
+
+        # Many descriptions share a key; keep one copy of each
+        key = sys.intern(key)
+        self._key_cache[description] = key
+        return key
+
+    def extract_cluster_keys(self, descriptions: list[str]) -> list[str]:
+        """Extract cluster keys for a batch of descriptions.
+
+        Equivalent to calling extract_cluster_key() for each description, but
+        each distinct description is only resolved once. When the batch holds
+        at least VECTORIZE_THRESHOLD uncached printable ASCII descriptions,
+        their keys are computed together with Arrow compute kernels, whose
+        string handling matches Python's for such text, in batches of
+        VECTORIZE_CHUNK_SIZE spread across threads.
 
-        if not words:
-            return "UNCLUSTERED"
+        Args:
+            descriptions: Raw transaction descriptions.
+
+        Returns:
+            Cluster keys in the same order as the descriptions.
+        """
+        key_cache = self._key_cache
+        unique_descriptions = list(dict.fromkeys(descriptions))
+        pending = [
+            d
+            for d in unique_descriptions
+            if d not in key_cache and d.isascii() and d.isprintable()
+        ]
+        # str.replace() with an empty pattern has no Arrow equivalent
+        if len(pending) >= self.VECTORIZE_THRESHOLD and all(self._strip_patterns):
+            size = self.VECTORIZE_CHUNK_SIZE
+            chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+            if len(chunks) == 1:
+                chunk_keys = [self._vectorized_cluster_keys(pending)]
+            else:
+                workers = min(len(chunks), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    chunk_keys = list(
+                        executor.map(self._vectorized_cluster_keys, chunks)
+                    )
+            for chunk, keys in zip(chunks, chunk_keys, strict=True):
+                key_cache.update(zip(chunk, keys, strict=True))
+
+        # Resolve each distinct description once, then map rows by lookup
+        extract = self.extract_cluster_key
+        key_by_description = {d: extract(d) for d in unique_descriptions}
+        return [key_by_description[d] for d in descriptions]
+
+    def _vectorized_cluster_keys(self, descriptions: list[str]) -> list[str]:
+        """Compute cluster keys for printable ASCII descriptions with Arrow.
+
+        Mirrors normalize_description() followed by taking the first word.
 
-        # Return first word as cluster key
-        # This handles most merchant names well
-        return words[0]
+        Args:
+            descriptions: Printable ASCII descriptions.
+
+        Returns:
+            Cluster keys in the same order as the descriptions.
+        """
+        normalized = pc.utf8_upper(pa.array(descriptions, type=pa.string()))
+        for strip_pattern in self._strip_patterns:
+            normalized = pc.replace_substring(
+                normalized, pattern=strip_pattern.upper(), replacement=" "
+            )
+        normalized = pc.replace_substring_regex(
+            normalized, pattern=_ASCII_REMOVAL_RE2, replacement=" "
+        )
+
+        words = pc.ascii_split_whitespace(normalized)
+        flat_words = pc.list_flatten(words)
+        rows = pc.list_parent_indices(words)
+        significant = pc.invert(
+            pc.is_in(flat_words, value_set=self._INSIGNIFICANT_WORDS)
+        )
+        first_words = (
+            pa.table(
+                {
+                    "row": rows.filter(significant),
+                    "word": flat_words.filter(significant),
+                }
+            )
+            .group_by("row", use_threads=False)
+            .aggregate([("word", "first")])
+        )
+
+        keys = ["UNCLUSTERED"] * len(descriptions)
+        for row, word in zip(
+            first_words["row"].to_pylist(),
+            first_words["word_first"].to_pylist(),
+            strict=True,
+        ):
+            keys[row] = sys.intern(word)
+        return keys
 
     def compute_cluster_hash(self, cluster_key: str) -> str:
         """Compute a unique hash for a cluster.
 
+        The hash is stored on refinement sessions and rule proposals and used
+        to find them again, so it must stay SHA-256. Hashes are cached per key.
+
         Args:
             cluster_key: The cluster key string.
 
         Returns:
             SHA-256 hash of the cluster key.
         """
-        return hashlib.sha256(cluster_key.encode("utf-8")).hexdigest()
+        cluster_hash = self._hash_cache.get(cluster_key)
+        if cluster_hash is None:
+            cluster_hash = hashlib.sha256(cluster_key.encode("utf-8")).hexdigest()
+            self._hash_cache[cluster_key] = cluster_hash
+        return cluster_hash
 
     def cluster_transactions(
-        self, transactions: list[Transaction]
+        self, transactions: list[Transaction], compute_samples: bool = True
     ) -> list[TransactionCluster]:
         """Cluster transactions by description similarity.
 
         Args:
             transactions: List of transactions to cluster.
+            compute_samples: Whether to collect sample descriptions. When False,
+                every cluster gets an empty sample_descriptions list.
 
         Returns:
             List of TransactionCluster objects, sorted by size (largest first).
         """
         # Group by cluster key
-        clusters_dict: dict[str, list[Transaction]] = {}
+        clusters_dict: defaultdict[str, list[Transaction]] = defaultdict(list)
 
-        for txn in transactions:
-            if not txn.description:
-                continue
+        described = [txn for txn in transactions if txn.description]
+        keys = self.extract_cluster_keys([txn.description for txn in described])
 
-            key = self.extract_cluster_key(txn.description)
-            if key not in clusters_dict:
-                clusters_dict[key] = []
+        for txn, key in zip(described, keys, strict=True):
             clusters_dict[key].append(txn)
 
-        # Convert to TransactionCluster objects
-        clusters: list[TransactionCluster] = []
+        # Convert to TransactionCluster objects, bucketed by size so they can
+        # be ordered without a comparison sort (sizes repeat heavily)
+        clusters_by_size: defaultdict[int, list[TransactionCluster]] = defaultdict(list)
+
+        min_size = self._min_cluster_size
+        max_samples = self._max_samples
 
         for key, txns in clusters_dict.items():
-            if len(txns) < self._min_cluster_size:
+            size = len(txns)
+            if size < min_size:
                 continue
 
-            # Get unique sample descriptions
-            unique_descriptions = list(
-                dict.fromkeys(t.description for t in txns if t.description)
-            )
-            samples = unique_descriptions[: self._max_samples]
+            if compute_samples:
+                # Get unique sample descriptions (all grouped ones are non-empty)
+                samples = list(dict.fromkeys(t.description for t in txns))
+                del samples[max_samples:]
+            else:
+                samples = []
 
             cluster = TransactionCluster(
                 cluster_key=key,
@@ -208,12 +421,14 @@ class TransactionClusteringService:
                 transactions=txns,
                 sample_descriptions=samples,
             )
-            clusters.append(cluster)
-
-        # Sort by size (largest first)
-        clusters.sort(key=lambda c: c.size, reverse=True)
+            clusters_by_size[size].append(cluster)
 
-        return clusters
+        # Largest first, keeping first-seen order among equal sizes
+        return [
+            cluster
+            for size in sorted(clusters_by_size, reverse=True)
+            for cluster in clusters_by_size[size]
+        ]
 
     def get_cluster_statistics(
         self, clusters: list[TransactionCluster], total_transactions: int
@@ -238,8 +453,15 @@ class TransactionClusteringService:
                 average_cluster_size=0.0,
             )
 
-        clustered_count = sum(c.size for c in clusters)
-        sizes = [c.size for c in clusters]
+        # Single pass over the clusters for total, largest and smallest size
+        clustered_count = largest = smallest = clusters[0].size
+        for cluster in clusters[1:]:
+            size = cluster.size
+            clustered_count += size
+            if size > largest:
+                largest = size
+            elif size < smallest:
+                smallest = size
 
         return ClusterStatistics(
             total_transactions=total_transactions,
@@ -250,9 +472,9 @@ class TransactionClusteringService:
                 if total_transactions > 0
                 else 0.0
             ),
-            largest_cluster_size=max(sizes),
-            smallest_cluster_size=min(sizes),
-            average_cluster_size=sum(sizes) / len(sizes),
+            largest_cluster_size=largest,
+            smallest_cluster_size=smallest,
+            average_cluster_size=clustered_count / len(clusters),
         )
 
     def get_unclustered_transactions(
@@ -267,10 +489,9 @@ class TransactionClusteringService:
         Returns:
             List of transactions not in any cluster.
         """
-        clustered_ids = set()
-        for cluster in clusters:
-            for txn in cluster.transactions:
-                clustered_ids.add(txn.id)
+        # Each cluster already holds its ID set; union them instead of
+        # re-reading every clustered transaction
+        clustered_ids = frozenset[int]().union(*(c.transaction_ids for c in clusters))
 
         return [t for t in transactions if t.id not in clustered_ids]
 
@@ -5,7 +5,7 @@ from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import Connection, Engine, create_engine, event, make_url, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from finance_api.db.base import Base, import_models
@@ -24,6 +24,36 @@ def get_test_database_url() -> str | None:
     return os.environ.get("DATABASE_URL")
 
 
+def get_test_schema() -> str:
+    """Get the schema integration test tables are created in.
+
+    Under pytest-xdist each worker gets its own copy of the 'finance' schema
+    (e.g. 'finance_gw0'), so workers can run SQL Server tests concurrently.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"finance_{worker}" if worker else "finance"
+
+
+def create_sqlite_engine() -> Engine:
+    """Create an in-memory SQLite engine with the 'finance' schema attached.
+
+    Uses SQLite's ATTACH DATABASE to simulate the 'finance' schema.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def setup_sqlite(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("ATTACH DATABASE ':memory:' AS finance")
+        cursor.close()
+
+    return engine
+
+
 def is_sqlserver_available() -> bool:
     """Check if SQL Server is available for integration tests."""
     url = get_test_database_url()
@@ -62,18 +92,7 @@ def in_memory_db() -> Generator[Session, None, None]:
     Uses SQLite's ATTACH DATABASE to simulate the 'finance' schema.
     This fixture is fast and doesn't require external dependencies.
     """
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-    )
-
-    @event.listens_for(engine, "connect")
-    def setup_sqlite(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.execute("ATTACH DATABASE ':memory:' AS finance")
-        cursor.close()
-
+    engine = create_sqlite_engine()
     import_models()
     Base.metadata.create_all(bind=engine)
 
@@ -93,6 +112,72 @@ def db_session(in_memory_db: Session) -> Session:
     return in_memory_db
 
 
+@pytest.fixture(scope="class")
+def shared_db_connection() -> Generator[Connection, None, None]:
+    """Create an in-memory SQLite database shared by every test in a class.
+
+    Data created by class-scoped fixtures lives in one outer transaction, and
+    each test runs in a SAVEPOINT inside it (see shared_db_session).
+    """
+    engine = create_sqlite_engine()
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; emit BEGIN ourselves
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin_transaction(conn):  # type: ignore[no-untyped-def]
+        conn.exec_driver_sql("BEGIN")
+
+    import_models()
+    connection = engine.connect()
+    Base.metadata.create_all(bind=connection)
+    connection.commit()
+    transaction = connection.begin()
+
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+@pytest.fixture(scope="class")
+def fixture_session(
+    shared_db_connection: Connection,
+) -> Generator[Session, None, None]:
+    """Create a session for writing data shared by every test in a class."""
+    session = Session(bind=shared_db_connection, autoflush=False)
+
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def shared_db_session(
+    shared_db_connection: Connection,
+) -> Generator[Session, None, None]:
+    """Create a session whose changes are rolled back after each test.
+
+    The session joins the shared connection's transaction through a SAVEPOINT,
+    so data from class-scoped fixtures is visible but never modified.
+    """
+    session = Session(
+        bind=shared_db_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 # ============================================================================
 # Integration test fixtures (SQL Server)
 # ============================================================================
@@ -103,13 +188,17 @@ def sqlserver_engine():
     """Create a SQL Server engine for integration tests.
 
     This fixture is session-scoped for efficiency - the engine is reused
-    across all integration tests.
+    across all integration tests. With pyodbc, executemany() sends all
+    parameter sets in one round trip (fast_executemany).
     """
     url = get_test_database_url()
     if not url:
         pytest.skip("DATABASE_URL not set - skipping SQL Server integration tests")
 
-    engine = create_engine(url)
+    if make_url(url).drivername == "mssql+pyodbc":
+        engine = create_engine(url, fast_executemany=True)
+    else:
+        engine = create_engine(url)
 
     # Verify connection
     try:
@@ -126,59 +215,73 @@ def sqlserver_setup(sqlserver_engine):
     """Set up the SQL Server schema once per test session.
 
     Creates the finance schema and all tables. Tables are preserved
-    between tests for efficiency, but data is cleaned up per-test.
+    between tests for efficiency, but each test's data is rolled back.
+    The yielded engine maps the models' 'finance' schema to get_test_schema();
+    a pytest-xdist worker's schema is dropped again when the session ends.
     """
     import_models()
 
-    with sqlserver_engine.connect() as conn:
-        # Create finance schema if it doesn't exist
-        conn.execute(
-            text(
-                "IF NOT EXISTS (SELECT * FROM sys.schemas WHERE name = 'finance') "
-                "EXEC('CREATE SCHEMA finance')"
-            )
-        )
+    schema = get_test_schema()
+    # The worker name comes from the environment, so quote it rather than
+    # interpolating it into DDL as-is
+    preparer = sqlserver_engine.dialect.identifier_preparer
+    quoted_schema = preparer.quote_identifier(schema)
+    engine = sqlserver_engine.execution_options(
+        schema_translate_map={"finance": schema}
+    )
+
+    with engine.connect() as conn:
+        # Create the schema if it doesn't exist
+        exists = conn.execute(
+            text("SELECT 1 FROM sys.schemas WHERE name = :schema"),
+            {"schema": schema},
+        ).first()
+        if exists is None:
+            conn.execute(text(f"CREATE SCHEMA {quoted_schema}"))
         conn.commit()
 
     # Create all tables
-    Base.metadata.create_all(bind=sqlserver_engine)
+    Base.metadata.create_all(bind=engine)
 
-    yield sqlserver_engine
+    yield engine
 
-    # Teardown: drop all tables (optional - can be removed if you want to inspect)
-    # Base.metadata.drop_all(bind=sqlserver_engine)
+    # Teardown: pytest-xdist worker schemas are dropped with their tables.
+    # The shared 'finance' tables are kept.
+    if schema != "finance":
+        Base.metadata.drop_all(bind=engine)
+        with engine.connect() as conn:
+            conn.execute(text(f"DROP SCHEMA {quoted_schema}"))
+            conn.commit()
 
 
 @pytest.fixture
 def sqlserver_session(sqlserver_setup) -> Generator[Session, None, None]:
     """Create a SQL Server session for integration tests.
 
-    Each test gets a fresh session with transaction rollback for isolation.
-    Data is cleaned up after each test.
+    Each test runs inside one outer transaction that is rolled back afterwards,
+    so nothing is ever committed and no per-test cleanup is needed. The session
+    joins it through a SAVEPOINT, so a commit() in the code under test only
+    releases the savepoint.
     """
     engine = sqlserver_setup
 
-    # Create session
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = TestingSessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Nothing is really committed, so there is no need to reload objects
+    # after the code under test calls commit()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
-
-        # Clean up data from all tables (in correct order for FK constraints)
-        with engine.connect() as conn:
-            conn.execute(text("DELETE FROM finance.rule_proposals"))
-            conn.execute(text("DELETE FROM finance.transaction_categories"))
-            conn.execute(text("DELETE FROM finance.category_closure"))
-            conn.execute(text("DELETE FROM finance.classification_rules"))
-            conn.execute(text("DELETE FROM finance.online_purchases"))
-            conn.execute(text("DELETE FROM finance.transactions"))
-            conn.execute(text("DELETE FROM finance.categories"))
-            conn.execute(text("DELETE FROM finance.bank_sessions"))
-            conn.commit()
+        transaction.rollback()
+        connection.close()
 
 
 # ============================================================================
@@ -8,6 +8,7 @@ from datetime import date
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from finance_api.models.category import Category, CategoryClosure
@@ -32,142 +33,148 @@ from finance_api.services.rules_classification_service import (
 
 
 @pytest.fixture
-def setup_categories(db_session: Session) -> dict[str, Category]:
+def db_session(shared_db_session: Session) -> Session:
+    """Run each test in a SAVEPOINT over the class-scoped fixture data."""
+    return shared_db_session
+
+
+@pytest.fixture(scope="class")
+def setup_categories(fixture_session: Session) -> dict[str, Category]:
     """Create a realistic category hierarchy for testing."""
-    categories = {}
+    db_session = fixture_session
 
     # Create parent categories
-    for name in ["Food", "Shopping", "Utilities", "Transport", "Entertainment"]:
-        cat = Category(name=name, commitment_level=2)
-        db_session.add(cat)
-        db_session.flush()
-        # Add closure entry
-        closure = CategoryClosure(ancestor_id=cat.id, descendant_id=cat.id, depth=0)
-        db_session.add(closure)
-        categories[name] = cat
-
-    # Create child categories under Food
-    food_children = ["Groceries", "Restaurants", "Coffee Shops", "Takeaway"]
-    for name in food_children:
-        cat = Category(name=name, parent_id=categories["Food"].id, commitment_level=2)
-        db_session.add(cat)
-        db_session.flush()
-        # Self-reference closure
-        closure = CategoryClosure(ancestor_id=cat.id, descendant_id=cat.id, depth=0)
-        db_session.add(closure)
-        # Parent closure
-        closure2 = CategoryClosure(
-            ancestor_id=categories["Food"].id, descendant_id=cat.id, depth=1
-        )
-        db_session.add(closure2)
-        categories[name] = cat
-
-    # Create child categories under Shopping
-    shopping_children = ["Electronics", "Clothing", "Home & Garden", "General"]
-    for name in shopping_children:
-        cat = Category(
-            name=name, parent_id=categories["Shopping"].id, commitment_level=3
+    parents = [
+        Category(name=name, commitment_level=2)
+        for name in ["Food", "Shopping", "Utilities", "Transport", "Entertainment"]
+    ]
+    db_session.add_all(parents)
+    db_session.flush()
+    categories = {cat.name: cat for cat in parents}
+
+    # Create child categories under Food and Shopping
+    children_by_parent = {
+        "Food": (["Groceries", "Restaurants", "Coffee Shops", "Takeaway"], 2),
+        "Shopping": (["Electronics", "Clothing", "Home & Garden", "General"], 3),
+    }
+    children = [
+        Category(
+            name=name,
+            parent_id=categories[parent].id,
+            commitment_level=commitment_level,
         )
-        db_session.add(cat)
-        db_session.flush()
-        closure = CategoryClosure(ancestor_id=cat.id, descendant_id=cat.id, depth=0)
-        db_session.add(closure)
-        closure2 = CategoryClosure(
-            ancestor_id=categories["Shopping"].id, descendant_id=cat.id, depth=1
+        for parent, (names, commitment_level) in children_by_parent.items()
+        for name in names
+    ]
+    db_session.add_all(children)
+    db_session.flush()
+    categories.update((cat.name, cat) for cat in children)
+
+    # Self-reference closure for every category
+    db_session.execute(
+        insert(CategoryClosure),
+        [
+            {"ancestor_id": cat.id, "descendant_id": cat.id, "depth": 0}
+            for cat in categories.values()
+        ],
+    )
+
+    # Children inherit every ancestor entry of their parent, one level deeper
+    db_session.execute(
+        insert(CategoryClosure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(
+                CategoryClosure.ancestor_id,
+                Category.id,
+                CategoryClosure.depth + 1,
+            )
+            .join(Category, Category.parent_id == CategoryClosure.descendant_id)
+            .where(Category.id.in_([cat.id for cat in children])),
         )
-        db_session.add(closure2)
-        categories[name] = cat
+    )
 
-    db_session.flush()
     return categories
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def setup_rules(
-    db_session: Session,
+    fixture_session: Session,
     setup_categories: dict[str, Category],
 ) -> list:
     """Create realistic classification rules."""
-    rule_repo = ClassificationRuleRepository(db_session)
-    rules = []
-
-    # Groceries rules (high priority)
-    rules.append(
-        rule_repo.create(
-            name="Tesco",
-            rule_expression='description =~ "(?i)tesco"',
-            category_id=setup_categories["Groceries"].id,
-            priority=100,
-        )
-    )
-    rules.append(
-        rule_repo.create(
-            name="Sainsburys",
-            rule_expression='description =~ "(?i)sainsbury"',
-            category_id=setup_categories["Groceries"].id,
-            priority=100,
-        )
-    )
-    rules.append(
-        rule_repo.create(
-            name="Asda",
-            rule_expression='description =~ "(?i)asda"',
-            category_id=setup_categories["Groceries"].id,
-            priority=100,
-        )
-    )
-
-    # Coffee shops
-    rules.append(
-        rule_repo.create(
-            name="Starbucks",
-            rule_expression='description =~ "(?i)starbucks"',
-            category_id=setup_categories["Coffee Shops"].id,
-            priority=90,
-        )
-    )
-    rules.append(
-        rule_repo.create(
-            name="Costa Coffee",
-            rule_expression='description =~ "(?i)costa"',
-            category_id=setup_categories["Coffee Shops"].id,
-            priority=90,
-        )
-    )
-
-    # Restaurants
-    rules.append(
-        rule_repo.create(
-            name="McDonalds",
-            rule_expression='description =~ "(?i)mcdonald"',
-            category_id=setup_categories["Restaurants"].id,
-            priority=85,
-        )
-    )
-
-    # Utilities
-    rules.append(
-        rule_repo.create(
-            name="British Gas",
-            rule_expression='description =~ "(?i)british gas"',
-            category_id=setup_categories["Utilities"].id,
-            priority=100,
-        )
+    rule_repo = ClassificationRuleRepository(fixture_session)
+    groceries = setup_categories["Groceries"].id
+    coffee_shops = setup_categories["Coffee Shops"].id
+
+    return rule_repo.create_batch(
+        [
+            # Groceries rules (high priority)
+            {
+                "name": "Tesco",
+                "rule_expression": 'description =~ "(?i)tesco"',
+                "category_id": groceries,
+                "priority": 100,
+            },
+            {
+                "name": "Sainsburys",
+                "rule_expression": 'description =~ "(?i)sainsbury"',
+                "category_id": groceries,
+                "priority": 100,
+            },
+            {
+                "name": "Asda",
+                "rule_expression": 'description =~ "(?i)asda"',
+                "category_id": groceries,
+                "priority": 100,
+            },
+            # Coffee shops
+            {
+                "name": "Starbucks",
+                "rule_expression": 'description =~ "(?i)starbucks"',
+                "category_id": coffee_shops,
+                "priority": 90,
+            },
+            {
+                "name": "Costa Coffee",
+                "rule_expression": 'description =~ "(?i)costa"',
+                "category_id": coffee_shops,
+                "priority": 90,
+            },
+            # Restaurants
+            {
+                "name": "McDonalds",
+                "rule_expression": 'description =~ "(?i)mcdonald"',
+                "category_id": setup_categories["Restaurants"].id,
+                "priority": 85,
+            },
+            # Utilities
+            {
+                "name": "British Gas",
+                "rule_expression": 'description =~ "(?i)british gas"',
+                "category_id": setup_categories["Utilities"].id,
+                "priority": 100,
+            },
+            # Shopping - needs disambiguation (Amazon, eBay)
+            {
+                "name": "Amazon (needs disambiguation)",
+                "rule_expression": 'description =~ "(?i)amazon"',
+                "category_id": setup_categories["General"].id,  # Default to General
+                "priority": 50,
+                "requires_disambiguation": True,
+            },
+        ]
     )
 
-    # Shopping - needs disambiguation (Amazon, eBay)
-    rules.append(
-        rule_repo.create(
-            name="Amazon (needs disambiguation)",
-            rule_expression='description =~ "(?i)amazon"',
-            category_id=setup_categories["General"].id,  # Default to General
-            priority=50,
-            requires_disambiguation=True,
-        )
-    )
 
-    db_session.flush()
-    return rules
+@pytest.fixture(scope="class")
+def rules_service(
+    fixture_session: Session,
+    setup_rules: list,
+) -> RulesClassificationService:
+    """Create a rules service with setup_rules loaded, shared by a test class."""
+    service = RulesClassificationService(ClassificationRuleRepository(fixture_session))
+    service.reload_rules()
+    return service
 
 
 @pytest.fixture
@@ -192,6 +199,31 @@ def create_transactions(db_session: Session):
     return _create
 
 
+@pytest.fixture
+def create_transactions_bulk(db_session: Session):
+    """Factory to create several test transactions with one INSERT."""
+
+    def _create(rows: list[tuple[str, Decimal]]) -> list[Transaction]:
+        return list(
+            db_session.scalars(
+                insert(Transaction).returning(
+                    Transaction, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "transaction_date": date(2026, 1, 15),
+                        "description": description,
+                        "amount": amount,
+                        "currency": "GBP",
+                    }
+                    for description, amount in rows
+                ],
+            )
+        )
+
+    return _create
+
+
 # ============================================================================
 # End-to-End Integration Tests
 # ============================================================================
@@ -204,29 +236,17 @@ class TestClassificationPipelineIntegration:
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list,
+        rules_service: RulesClassificationService,
         create_transactions,
     ) -> None:
         """Test classifying a single transaction that matches a rule."""
         # Create services
-        rule_repo = ClassificationRuleRepository(db_session)
         evidence_repo = CategoryEvidenceRepository(db_session)
-        rules_service = RulesClassificationService(rule_repo)
-        rules_service.reload_rules()
-
-        assigned_categories: dict[int, int] = {}
-
-        def category_updater(txn_id: int, cat_id: int) -> TransactionCategory:
-            assigned_categories[txn_id] = cat_id
-            link = TransactionCategory(transaction_id=txn_id, category_id=cat_id)
-            db_session.add(link)
-            return link
 
         orchestrator = ClassificationOrchestrator(
             rules_service=rules_service,
             disambiguation_service=None,
             evidence_repository=evidence_repo,
-            transaction_category_updater=category_updater,
         )
 
         # Create test transaction
@@ -253,37 +273,39 @@ class TestClassificationPipelineIntegration:
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list,
-        create_transactions,
+        rules_service: RulesClassificationService,
+        create_transactions_bulk,
     ) -> None:
         """Test batch classification with mixed results."""
         # Create services
-        rule_repo = ClassificationRuleRepository(db_session)
         evidence_repo = CategoryEvidenceRepository(db_session)
-        rules_service = RulesClassificationService(rule_repo)
-        rules_service.reload_rules()
 
-        assigned_categories: dict[int, int] = {}
-
-        def category_updater(txn_id: int, cat_id: int) -> TransactionCategory:
-            assigned_categories[txn_id] = cat_id
-            return TransactionCategory(transaction_id=txn_id, category_id=cat_id)
+        def category_batch_updater(assignments: list[tuple[int, int]]) -> None:
+            db_session.execute(
+                insert(TransactionCategory),
+                [
+                    {"transaction_id": txn_id, "category_id": cat_id}
+                    for txn_id, cat_id in assignments
+                ],
+            )
 
         orchestrator = ClassificationOrchestrator(
             rules_service=rules_service,
             disambiguation_service=None,
             evidence_repository=evidence_repo,
-            transaction_category_updater=category_updater,
+            transaction_category_batch_updater=category_batch_updater,
         )
 
         # Create test transactions
-        transactions = [
-            create_transactions("TESCO STORES 1234", Decimal("-45.67")),
-            create_transactions("STARBUCKS COFFEE", Decimal("-4.50")),
-            create_transactions("BRITISH GAS DD", Decimal("-120.00")),
-            create_transactions("UNKNOWN MERCHANT ABC", Decimal("-25.00")),
-            create_transactions("MCDONALDS LONDON", Decimal("-8.99")),
-        ]
+        transactions = create_transactions_bulk(
+            [
+                ("TESCO STORES 1234", Decimal("-45.67")),
+                ("STARBUCKS COFFEE", Decimal("-4.50")),
+                ("BRITISH GAS DD", Decimal("-120.00")),
+                ("UNKNOWN MERCHANT ABC", Decimal("-25.00")),
+                ("MCDONALDS LONDON", Decimal("-8.99")),
+            ]
+        )
 
         # Classify batch
         results = orchestrator.classify_batch(transactions)
@@ -321,19 +343,26 @@ class TestClassificationPipelineIntegration:
             == setup_categories["Restaurants"].id
         )
 
+        # Category links were inserted for the four classified transactions
+        links = db_session.execute(
+            select(TransactionCategory.transaction_id, TransactionCategory.category_id)
+        ).all()
+        assert sorted(links) == sorted(
+            (txn.id, results[txn.id].category_id)
+            for txn in transactions
+            if results[txn.id].classified
+        )
+
     def test_classification_statistics(
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list,
-        create_transactions,
+        rules_service: RulesClassificationService,
+        create_transactions_bulk,
     ) -> None:
         """Test classification statistics gathering."""
         # Create services
-        rule_repo = ClassificationRuleRepository(db_session)
         evidence_repo = CategoryEvidenceRepository(db_session)
-        rules_service = RulesClassificationService(rule_repo)
-        rules_service.reload_rules()
 
         orchestrator = ClassificationOrchestrator(
             rules_service=rules_service,
@@ -342,17 +371,18 @@ class TestClassificationPipelineIntegration:
         )
 
         # Create transactions with different outcomes
-        transactions = [
-            create_transactions("TESCO STORES", Decimal("-50.00")),
-            create_transactions("SAINSBURYS LOCAL", Decimal("-30.00")),
-            create_transactions("STARBUCKS", Decimal("-5.00")),
-            create_transactions("RANDOM SHOP 123", Decimal("-15.00")),
-            create_transactions("UNKNOWN VENDOR XYZ", Decimal("-20.00")),
-        ]
+        transactions = create_transactions_bulk(
+            [
+                ("TESCO STORES", Decimal("-50.00")),
+                ("SAINSBURYS LOCAL", Decimal("-30.00")),
+                ("STARBUCKS", Decimal("-5.00")),
+                ("RANDOM SHOP 123", Decimal("-15.00")),
+                ("UNKNOWN VENDOR XYZ", Decimal("-20.00")),
+            ]
+        )
 
         # Classify
-        results = orchestrator.classify_batch(transactions)
-        stats = orchestrator.get_classification_statistics(results)
+        results, stats = orchestrator.classify_batch_with_statistics(transactions)
 
         # Verify statistics
         assert stats["total"] == 5
@@ -365,15 +395,12 @@ class TestClassificationPipelineIntegration:
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list,
+        rules_service: RulesClassificationService,
         create_transactions,
     ) -> None:
         """Test that already classified transactions are skipped."""
         # Create services
-        rule_repo = ClassificationRuleRepository(db_session)
         evidence_repo = CategoryEvidenceRepository(db_session)
-        rules_service = RulesClassificationService(rule_repo)
-        rules_service.reload_rules()
 
         # Create transaction and pre-classify it
         txn = create_transactions("TESCO STORES", Decimal("-50.00"))
@@ -383,7 +410,8 @@ class TestClassificationPipelineIntegration:
         )
         db_session.add(pre_assigned)
         db_session.flush()
-        db_session.refresh(txn)
+        # Reload the link so the orchestrator sees the pre-assigned category
+        db_session.expire(txn, ["category_link"])
 
         orchestrator = ClassificationOrchestrator(
             rules_service=rules_service,
@@ -402,15 +430,12 @@ class TestClassificationPipelineIntegration:
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list,
+        rules_service: RulesClassificationService,
         create_transactions,
     ) -> None:
         """Test force reclassification overrides existing category."""
         # Create services
-        rule_repo = ClassificationRuleRepository(db_session)
         evidence_repo = CategoryEvidenceRepository(db_session)
-        rules_service = RulesClassificationService(rule_repo)
-        rules_service.reload_rules()
 
         assigned_categories: dict[int, int] = {}
 
@@ -426,7 +451,6 @@ class TestClassificationPipelineIntegration:
         )
         db_session.add(pre_assigned)
         db_session.flush()
-        db_session.refresh(txn)
 
         orchestrator = ClassificationOrchestrator(
             rules_service=rules_service,
@@ -447,14 +471,11 @@ class TestClassificationPipelineIntegration:
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list,  # Use pre-configured rules
-        create_transactions,
+        rules_service: RulesClassificationService,  # Pre-configured rules
+        create_transactions_bulk,
     ) -> None:
         """Test that lower priority value rules are evaluated first."""
-        rule_repo = ClassificationRuleRepository(db_session)
         evidence_repo = CategoryEvidenceRepository(db_session)
-        rules_service = RulesClassificationService(rule_repo)
-        rules_service.reload_rules()
 
         orchestrator = ClassificationOrchestrator(
             rules_service=rules_service,
@@ -462,20 +483,25 @@ class TestClassificationPipelineIntegration:
             evidence_repository=evidence_repo,
         )
 
+        txn1, txn2, txn3 = create_transactions_bulk(
+            [
+                ("STARBUCKS COFFEE", Decimal("-4.00")),
+                ("COSTA COFFEE SHOP", Decimal("-3.50")),
+                ("TESCO METRO", Decimal("-25.00")),
+            ]
+        )
+
         # Test 1: Starbucks matches "Starbucks" rule at priority 90
-        txn1 = create_transactions("STARBUCKS COFFEE", Decimal("-4.00"))
         result1 = orchestrator.classify(txn1)
         assert result1.classified is True
         assert result1.rule_name == "Starbucks"
 
         # Test 2: Costa matches "Costa Coffee" rule at priority 90
-        txn2 = create_transactions("COSTA COFFEE SHOP", Decimal("-3.50"))
         result2 = orchestrator.classify(txn2)
         assert result2.classified is True
         assert result2.rule_name == "Costa Coffee"
 
         # Test 3: Tesco has higher priority (100) - should match
-        txn3 = create_transactions("TESCO METRO", Decimal("-25.00"))
         result3 = orchestrator.classify(txn3)
         assert result3.classified is True
         assert result3.rule_name == "Tesco"
@@ -485,26 +511,16 @@ class TestClassificationPipelineIntegration:
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list,  # Includes Amazon rule with requires_disambiguation=True
+        rules_service: RulesClassificationService,  # Includes Amazon rule
         create_transactions,
     ) -> None:
         """Test transaction requiring disambiguation when no service available."""
-        rule_repo = ClassificationRuleRepository(db_session)
         evidence_repo = CategoryEvidenceRepository(db_session)
-        rules_service = RulesClassificationService(rule_repo)
-        rules_service.reload_rules()
-
-        assigned_categories: dict[int, int] = {}
-
-        def category_updater(txn_id: int, cat_id: int) -> TransactionCategory:
-            assigned_categories[txn_id] = cat_id
-            return TransactionCategory(transaction_id=txn_id, category_id=cat_id)
 
         orchestrator = ClassificationOrchestrator(
             rules_service=rules_service,
             disambiguation_service=None,  # No disambiguation service
             evidence_repository=evidence_repo,
-            transaction_category_updater=category_updater,
         )
 
         # Amazon transaction (requires disambiguation)
@@ -10,9 +10,10 @@ These tests verify the full rule discovery flow including:
 import json
 from datetime import date
 from decimal import Decimal
+from typing import Any
 
 import pytest
-from sqlalchemy import func
+from sqlalchemy import func, insert, inspect
 from sqlalchemy.orm import Session
 
 from finance_api.models.category import Category, CategoryClosure
@@ -23,9 +24,11 @@ from finance_api.repositories.classification_rule_repository import (
     ClassificationRuleRepository,
 )
 from finance_api.repositories.rule_proposal_repository import RuleProposalRepository
+from finance_api.scripts.classify_batch import get_uncategorized_transactions
 from finance_api.services.rule_validation_service import RuleValidationService
 from finance_api.services.rules_classification_service import RulesClassificationService
 from finance_api.services.transaction_clustering_service import (
+    TransactionCluster,
     TransactionClusteringService,
 )
 
@@ -34,84 +37,119 @@ from finance_api.services.transaction_clustering_service import (
 # ============================================================================
 
 
+def categorize(
+    session: Session, transactions: list[Transaction], category: Category
+) -> None:
+    """Link transactions to a category with a single executemany INSERT."""
+    session.execute(
+        insert(TransactionCategory),
+        [
+            {"transaction_id": txn.id, "category_id": category.id}
+            for txn in transactions
+        ],
+    )
+
+
 @pytest.fixture
-def setup_categories(db_session: Session) -> dict[str, Category]:
+def db_session(shared_db_session: Session) -> Session:
+    """Run each test in a SAVEPOINT over the class-scoped fixture data."""
+    return shared_db_session
+
+
+@pytest.fixture(scope="class")
+def setup_categories(fixture_session: Session) -> dict[str, Category]:
     """Create a category hierarchy for testing."""
-    categories = {}
+    db_session = fixture_session
 
-    for name in ["Food", "Shopping", "Utilities", "Transport"]:
-        cat = Category(name=name, commitment_level=2)
-        db_session.add(cat)
-        db_session.flush()
-        closure = CategoryClosure(ancestor_id=cat.id, descendant_id=cat.id, depth=0)
-        db_session.add(closure)
-        categories[name] = cat
+    # Top-level categories, flushed together to get their IDs
+    parents = [
+        Category(name=name, commitment_level=2)
+        for name in ["Food", "Shopping", "Utilities", "Transport"]
+    ]
+    db_session.add_all(parents)
+    db_session.flush()
+    categories = {cat.name: cat for cat in parents}
 
     # Create subcategories
-    for name, parent in [
-        ("Groceries", "Food"),
-        ("Coffee", "Food"),
-        ("Electronics", "Shopping"),
-    ]:
-        cat = Category(name=name, parent_id=categories[parent].id, commitment_level=2)
-        db_session.add(cat)
-        db_session.flush()
-        closure = CategoryClosure(ancestor_id=cat.id, descendant_id=cat.id, depth=0)
-        db_session.add(closure)
-        closure2 = CategoryClosure(
-            ancestor_id=categories[parent].id, descendant_id=cat.id, depth=1
-        )
-        db_session.add(closure2)
-        categories[name] = cat
-
+    children = [
+        Category(name=name, parent_id=categories[parent].id, commitment_level=2)
+        for name, parent in [
+            ("Groceries", "Food"),
+            ("Coffee", "Food"),
+            ("Electronics", "Shopping"),
+        ]
+    ]
+    db_session.add_all(children)
     db_session.flush()
+    categories.update((cat.name, cat) for cat in children)
+
+    # Closure entries: self-reference for all, parent link for subcategories
+    db_session.execute(
+        insert(CategoryClosure),
+        [
+            {"ancestor_id": cat.id, "descendant_id": cat.id, "depth": 0}
+            for cat in categories.values()
+        ]
+        + [
+            {"ancestor_id": cat.parent_id, "descendant_id": cat.id, "depth": 1}
+            for cat in children
+        ],
+    )
     return categories
 
 
-@pytest.fixture
-def setup_transactions(db_session: Session) -> list[Transaction]:
+@pytest.fixture(scope="class")
+def setup_transactions(fixture_session: Session) -> list[Transaction]:
     """Create a diverse set of transactions for testing."""
-    transactions = []
+    rows: list[dict[str, Any]] = []
 
     # Tesco transactions (cluster)
+    base_amount = Decimal("-45.00")
     for i in range(10):
-        txn = Transaction(
-            transaction_date=date(2026, 1, 15),
-            description=f"TESCO STORES {1000 + i}",
-            amount=Decimal("-45.00") - Decimal(i),
-            currency="GBP",
+        rows.append(
+            {
+                "transaction_date": date(2026, 1, 15),
+                "description": f"TESCO STORES {1000 + i}",
+                "amount": base_amount - i,
+                "currency": "GBP",
+            }
         )
-        transactions.append(txn)
 
     # Sainsburys transactions (cluster)
+    base_amount = Decimal("-30.00")
     for i in range(8):
-        txn = Transaction(
-            transaction_date=date(2026, 1, 16),
-            description=f"SAINSBURYS LOCAL #{200 + i}",
-            amount=Decimal("-30.00") - Decimal(i),
-            currency="GBP",
+        rows.append(
+            {
+                "transaction_date": date(2026, 1, 16),
+                "description": f"SAINSBURYS LOCAL #{200 + i}",
+                "amount": base_amount - i,
+                "currency": "GBP",
+            }
         )
-        transactions.append(txn)
 
     # Starbucks transactions (cluster)
+    amount = Decimal("-4.50")
     for i in range(6):
-        txn = Transaction(
-            transaction_date=date(2026, 1, 17),
-            description=f"STARBUCKS COFFEE {i}",
-            amount=Decimal("-4.50"),
-            currency="GBP",
+        rows.append(
+            {
+                "transaction_date": date(2026, 1, 17),
+                "description": f"STARBUCKS COFFEE {i}",
+                "amount": amount,
+                "currency": "GBP",
+            }
         )
-        transactions.append(txn)
 
     # Amazon transactions (cluster - needs disambiguation)
+    base_amount = Decimal("-99.00")
     for i in range(5):
-        txn = Transaction(
-            transaction_date=date(2026, 1, 18),
-            description=f"AMAZON.CO.UK ORDER {3000 + i}",
-            amount=Decimal("-99.00") - Decimal(i * 10),
-            currency="GBP",
+        rows.append(
+            {
+                "transaction_date": date(2026, 1, 18),
+                "description": f"AMAZON.CO.UK ORDER {3000 + i}",
+                "amount": base_amount - i * 10,
+                "currency": "GBP",
+            }
         )
-        transactions.append(txn)
 
     # Unique transactions (no cluster)
     unique_descriptions = [
@@ -119,48 +157,72 @@ def setup_transactions(db_session: Session) -> list[Transaction]:
         "ONE TIME PURCHASE XYZ",
         "MYSTERIOUS VENDOR 123",
     ]
+    amount = Decimal("-25.00")
     for desc in unique_descriptions:
-        txn = Transaction(
-            transaction_date=date(2026, 1, 19),
-            description=desc,
-            amount=Decimal("-25.00"),
-            currency="GBP",
+        rows.append(
+            {
+                "transaction_date": date(2026, 1, 19),
+                "description": desc,
+                "amount": amount,
+                "currency": "GBP",
+            }
         )
-        transactions.append(txn)
 
-    db_session.add_all(transactions)
-    db_session.flush()
-    return transactions
+    # One INSERT for every row, returned in the order the rows were given
+    return list(
+        fixture_session.scalars(
+            insert(Transaction).returning(Transaction, sort_by_parameter_order=True),
+            rows,
+        )
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def setup_rules(
-    db_session: Session,
+    fixture_session: Session,
     setup_categories: dict[str, Category],
 ) -> list[ClassificationRule]:
     """Create classification rules for testing."""
-    rule_repo = ClassificationRuleRepository(db_session)
-    rules = []
-
-    rules.append(
-        rule_repo.create(
-            name="Tesco",
-            rule_expression='description =~ "(?i)tesco"',
-            category_id=setup_categories["Groceries"].id,
-            priority=100,
-        )
-    )
-    rules.append(
-        rule_repo.create(
-            name="Starbucks",
-            rule_expression='description =~ "(?i)starbucks"',
-            category_id=setup_categories["Coffee"].id,
-            priority=90,
-        )
+    rule_repo = ClassificationRuleRepository(fixture_session)
+    return rule_repo.create_batch(
+        [
+            {
+                "name": "Tesco",
+                "rule_expression": 'description =~ "(?i)tesco"',
+                "category_id": setup_categories["Groceries"].id,
+                "priority": 100,
+            },
+            {
+                "name": "Starbucks",
+                "rule_expression": 'description =~ "(?i)starbucks"',
+                "category_id": setup_categories["Coffee"].id,
+                "priority": 90,
+            },
+        ]
     )
 
-    db_session.flush()
-    return rules
+
+@pytest.fixture(scope="class")
+def clustering_service() -> TransactionClusteringService:
+    """Create the clustering service used by the clustering and validation tests."""
+    return TransactionClusteringService(min_cluster_size=3, max_samples=3)
+
+
+@pytest.fixture(scope="class")
+def clusters(
+    clustering_service: TransactionClusteringService,
+    setup_transactions: list[Transaction],
+) -> list[TransactionCluster]:
+    """Cluster the test transactions once for every test in a class."""
+    return clustering_service.cluster_transactions(setup_transactions)
+
+
+@pytest.fixture(scope="class")
+def clusters_by_key(
+    clusters: list[TransactionCluster],
+) -> dict[str, TransactionCluster]:
+    """Index the shared clusters by cluster key."""
+    return {c.cluster_key: c for c in clusters}
 
 
 # ============================================================================
@@ -195,13 +257,7 @@ class TestBatchClassificationIntegration:
     ) -> None:
         """Test coverage stats with partial categorization."""
         # Categorize first 5 transactions
-        for txn in setup_transactions[:5]:
-            link = TransactionCategory(
-                transaction_id=txn.id,
-                category_id=setup_categories["Groceries"].id,
-            )
-            db_session.add(link)
-        db_session.flush()
+        categorize(db_session, setup_transactions[:5], setup_categories["Groceries"])
 
         total = db_session.query(func.count(Transaction.id)).scalar()
         categorized = (
@@ -223,18 +279,8 @@ class TestBatchClassificationIntegration:
     ) -> None:
         """Test category distribution calculation."""
         # Assign transactions to different categories
-        for i, txn in enumerate(setup_transactions[:10]):
-            if i < 5:
-                cat_id = setup_categories["Groceries"].id
-            else:
-                cat_id = setup_categories["Coffee"].id
-
-            link = TransactionCategory(
-                transaction_id=txn.id,
-                category_id=cat_id,
-            )
-            db_session.add(link)
-        db_session.flush()
+        categorize(db_session, setup_transactions[:5], setup_categories["Groceries"])
+        categorize(db_session, setup_transactions[5:10], setup_categories["Coffee"])
 
         # Query distribution
         results = (
@@ -260,26 +306,16 @@ class TestBatchClassificationIntegration:
     ) -> None:
         """Test finding uncategorized transactions."""
         # Categorize some transactions
-        for txn in setup_transactions[:10]:
-            link = TransactionCategory(
-                transaction_id=txn.id,
-                category_id=setup_categories["Groceries"].id,
-            )
-            db_session.add(link)
-        db_session.flush()
+        categorize(db_session, setup_transactions[:10], setup_categories["Groceries"])
 
         # Find uncategorized
-        categorized_ids = (
-            db_session.query(TransactionCategory.transaction_id)
-            .filter(TransactionCategory.category_id.isnot(None))
-            .all()
-        )
-        categorized_id_set = {r[0] for r in categorized_ids}
-
-        all_txns = db_session.query(Transaction).all()
-        uncategorized = [t for t in all_txns if t.id not in categorized_id_set]
+        uncategorized = get_uncategorized_transactions(db_session)
 
         assert len(uncategorized) == len(setup_transactions) - 10
+        assert {t.id for t in uncategorized} == {t.id for t in setup_transactions[10:]}
+        # Category links are known to be empty, so no lazy load is needed
+        assert all("category_link" not in inspect(t).unloaded for t in uncategorized)
+        assert all(t.category_link is None for t in uncategorized)
 
     def test_batch_classification_with_rules(
         self,
@@ -320,14 +356,9 @@ class TestTransactionClusteringIntegration:
 
     def test_cluster_transactions_finds_groups(
         self,
-        db_session: Session,
-        setup_transactions: list[Transaction],
+        clusters: list[TransactionCluster],
     ) -> None:
         """Test clustering finds expected transaction groups."""
-        clustering_service = TransactionClusteringService(min_cluster_size=3)
-
-        clusters = clustering_service.cluster_transactions(setup_transactions)
-
         # Should find clusters for Tesco, Sainsburys, Starbucks, Amazon
         cluster_keys = {c.cluster_key for c in clusters}
         assert "TESCO" in cluster_keys
@@ -337,29 +368,21 @@ class TestTransactionClusteringIntegration:
 
     def test_cluster_sizes_are_correct(
         self,
-        db_session: Session,
-        setup_transactions: list[Transaction],
+        clusters_by_key: dict[str, TransactionCluster],
     ) -> None:
         """Test cluster sizes match expected counts."""
-        clustering_service = TransactionClusteringService(min_cluster_size=3)
-
-        clusters = clustering_service.cluster_transactions(setup_transactions)
-        cluster_sizes = {c.cluster_key: c.size for c in clusters}
-
-        assert cluster_sizes["TESCO"] == 10
-        assert cluster_sizes["SAINSBURYS"] == 8
-        assert cluster_sizes["STARBUCKS"] == 6
-        assert cluster_sizes["AMAZON"] == 5
+        assert clusters_by_key["TESCO"].size == 10
+        assert clusters_by_key["SAINSBURYS"].size == 8
+        assert clusters_by_key["STARBUCKS"].size == 6
+        assert clusters_by_key["AMAZON"].size == 5
 
     def test_cluster_statistics(
         self,
-        db_session: Session,
+        clustering_service: TransactionClusteringService,
+        clusters: list[TransactionCluster],
         setup_transactions: list[Transaction],
     ) -> None:
         """Test cluster statistics calculation."""
-        clustering_service = TransactionClusteringService(min_cluster_size=3)
-
-        clusters = clustering_service.cluster_transactions(setup_transactions)
         stats = clustering_service.get_cluster_statistics(
             clusters, len(setup_transactions)
         )
@@ -373,16 +396,10 @@ class TestTransactionClusteringIntegration:
 
     def test_cluster_sample_descriptions(
         self,
-        db_session: Session,
-        setup_transactions: list[Transaction],
+        clusters_by_key: dict[str, TransactionCluster],
     ) -> None:
         """Test cluster contains sample descriptions."""
-        clustering_service = TransactionClusteringService(
-            min_cluster_size=3, max_samples=3
-        )
-
-        clusters = clustering_service.cluster_transactions(setup_transactions)
-        tesco_cluster = next(c for c in clusters if c.cluster_key == "TESCO")
+        tesco_cluster = clusters_by_key["TESCO"]
 
         assert len(tesco_cluster.sample_descriptions) == 3
         for sample in tesco_cluster.sample_descriptions:
@@ -399,17 +416,15 @@ class TestRuleValidationIntegration:
 
     def test_validate_rule_precision(
         self,
-        db_session: Session,
+        clusters_by_key: dict[str, TransactionCluster],
         setup_transactions: list[Transaction],
     ) -> None:
         """Test rule precision calculation."""
         validation_service = RuleValidationService()
-        clustering_service = TransactionClusteringService(min_cluster_size=3)
 
         # Get Tesco cluster
-        clusters = clustering_service.cluster_transactions(setup_transactions)
-        tesco_cluster = next(c for c in clusters if c.cluster_key == "TESCO")
-        cluster_ids = {t.id for t in tesco_cluster.transactions}
+        tesco_cluster = clusters_by_key["TESCO"]
+        cluster_ids = tesco_cluster.transaction_ids
 
         # Test pattern
         result = validation_service.test_rule(
@@ -427,17 +442,15 @@ class TestRuleValidationIntegration:
 
     def test_validate_rule_with_false_positives(
         self,
-        db_session: Session,
+        clusters_by_key: dict[str, TransactionCluster],
         setup_transactions: list[Transaction],
     ) -> None:
         """Test rule validation identifies false positives."""
         validation_service = RuleValidationService()
-        clustering_service = TransactionClusteringService(min_cluster_size=3)
 
         # Get Tesco cluster
-        clusters = clustering_service.cluster_transactions(setup_transactions)
-        tesco_cluster = next(c for c in clusters if c.cluster_key == "TESCO")
-        cluster_ids = {t.id for t in tesco_cluster.transactions}
+        tesco_cluster = clusters_by_key["TESCO"]
+        cluster_ids = tesco_cluster.transaction_ids
 
         # Test overly broad pattern that matches multiple clusters
         result = validation_service.test_rule(
@@ -511,10 +524,14 @@ class TestRuleProposalIntegration:
         self,
         db_session: Session,
         setup_categories: dict[str, Category],
-        setup_rules: list[ClassificationRule],
     ) -> None:
         """Test updating proposal status to accepted."""
         proposal_repo = RuleProposalRepository(db_session)
+        rule = ClassificationRuleRepository(db_session).create(
+            name="Sainsburys",
+            rule_expression='description =~ "(?i)sainsbury"',
+            category_id=setup_categories["Groceries"].id,
+        )
 
         proposal = proposal_repo.create(
             cluster_hash="def456",
@@ -533,7 +550,7 @@ class TestRuleProposalIntegration:
         proposal_repo.update_status(
             proposal.id,
             status="accepted",
-            final_rule_id=setup_rules[0].id,
+            final_rule_id=rule.id,
             reviewer_notes="Looks good",
         )
         db_session.flush()
@@ -541,7 +558,7 @@ class TestRuleProposalIntegration:
         # Verify
         updated = proposal_repo.get(proposal.id)
         assert updated.status == "accepted"
-        assert updated.final_rule_id == setup_rules[0].id
+        assert updated.final_rule_id == rule.id
         assert updated.reviewer_notes == "Looks good"
 
     def test_get_pending_proposals(
@@ -629,7 +646,7 @@ class TestDiscoveryFlowIntegration:
 
         # Step 2: For each cluster, validate a proposed pattern
         for cluster in clusters[:2]:  # Process first 2 clusters
-            cluster_ids = {t.id for t in cluster.transactions}
+            cluster_ids = cluster.transaction_ids
             pattern = f"(?i){cluster.cluster_key.lower()}"
 
             validation = validation_service.test_rule(
@@ -663,17 +680,16 @@ class TestDiscoveryFlowIntegration:
         db_session: Session,
         setup_categories: dict[str, Category],
         setup_transactions: list[Transaction],
+        clusters_by_key: dict[str, TransactionCluster],
     ) -> None:
         """Test workflow through to rule creation."""
-        clustering_service = TransactionClusteringService(min_cluster_size=5)
         validation_service = RuleValidationService()
         proposal_repo = RuleProposalRepository(db_session)
         rule_repo = ClassificationRuleRepository(db_session)
 
         # Get Tesco cluster
-        clusters = clustering_service.cluster_transactions(setup_transactions)
-        tesco_cluster = next(c for c in clusters if c.cluster_key == "TESCO")
-        cluster_ids = {t.id for t in tesco_cluster.transactions}
+        tesco_cluster = clusters_by_key["TESCO"]
+        cluster_ids = tesco_cluster.transaction_ids
 
         # Validate pattern
         pattern = "(?i)tesco"
@@ -1,5 +1,7 @@
 """Tests for Category and CategoryClosure models."""
 
+import pytest
+
 from finance_api.models.category import Category, CategoryClosure
 
 
@@ -94,12 +96,13 @@ def test_category_with_commitment_level() -> None:
     assert category.commitment_level == 0
 
 
-def test_category_commitment_level_all_values() -> None:
+# 0=Survival, 1=Committed, 2=Lifestyle, 3=Discretionary, 4=Future
+@pytest.mark.parametrize("level", range(5))
+def test_category_commitment_level_all_values(level: int) -> None:
     """Test all valid commitment level values."""
-    # 0=Survival, 1=Committed, 2=Lifestyle, 3=Discretionary, 4=Future
-    for level in range(5):
-        category = Category(name=f"Level {level}", commitment_level=level)
-        assert category.commitment_level == level
+    category = Category(name=f"Level {level}", commitment_level=level)
+
+    assert category.commitment_level == level
 
 
 def test_category_commitment_level_nullable() -> None:
@@ -120,12 +123,14 @@ def test_category_with_frequency() -> None:
     assert category.frequency == "monthly"
 
 
-def test_category_frequency_values() -> None:
+@pytest.mark.parametrize(
+    "freq", ["monthly", "weekly", "annual", "one-time", "quarterly"]
+)
+def test_category_frequency_values(freq: str) -> None:
     """Test various frequency values."""
-    frequencies = ["monthly", "weekly", "annual", "one-time", "quarterly"]
-    for freq in frequencies:
-        category = Category(name=f"{freq} expense", frequency=freq)
-        assert category.frequency == freq
+    category = Category(name=f"{freq} expense", frequency=freq)
+
+    assert category.frequency == freq
 
 
 def test_category_frequency_nullable() -> None:
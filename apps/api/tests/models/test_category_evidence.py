@@ -150,10 +150,10 @@ def test_category_evidence_repr() -> None:
         evidence_type="email",
     )
 
-    repr_str = repr(evidence)
-    assert "id=1" in repr_str
-    assert "transaction_id=5" in repr_str
-    assert "..." in repr_str  # Truncation indicator
+    assert repr(evidence) == (
+        "<CategoryEvidence(id=1, transaction_id=5, "
+        "item='A very long product descriptio...')>"
+    )
 
 
 def test_category_evidence_table_name() -> None:
@@ -8,10 +8,11 @@ from finance_api.models.online_purchase import OnlinePurchase
 
 def test_online_purchase_creation() -> None:
     """Test OnlinePurchase can be instantiated with required fields."""
+    purchase_datetime = datetime(2026, 1, 15, 14, 30)
     purchase = OnlinePurchase(
         shop_name="Amazon",
         items="Book: Python Programming",
-        purchase_datetime=datetime(2026, 1, 15, 14, 30),
+        purchase_datetime=purchase_datetime,
         price=Decimal("29.99"),
         currency="GBP",  # Explicitly set for unit test (defaults apply on DB insert)
         is_deferred_payment=False,  # Explicitly set for unit test
@@ -19,7 +20,7 @@ def test_online_purchase_creation() -> None:
 
     assert purchase.shop_name == "Amazon"
     assert purchase.items == "Book: Python Programming"
-    assert purchase.purchase_datetime == datetime(2026, 1, 15, 14, 30)
+    assert purchase.purchase_datetime == purchase_datetime
     assert purchase.price == Decimal("29.99")
     assert purchase.currency == "GBP"
     assert purchase.is_deferred_payment is False
@@ -3,6 +3,8 @@
 import json
 from decimal import Decimal
 
+import pytest
+
 from finance_api.models.rule_proposal import RuleProposal
 
 
@@ -168,11 +170,9 @@ def test_rule_proposal_repr() -> None:
         status="pending",
     )
 
-    result = repr(proposal)
-    assert "RuleProposal" in result
-    assert "id=1" in result
-    assert "abc123de..." in result  # truncated hash
-    assert "pending" in result
+    assert repr(proposal) == (
+        "<RuleProposal(id=1, cluster_hash='abc123de...', status='pending')>"
+    )
 
 
 def test_rule_proposal_table_name() -> None:
@@ -181,28 +181,14 @@ def test_rule_proposal_table_name() -> None:
     assert RuleProposal.__table_args__[2]["schema"] == "finance"
 
 
-def test_rule_proposal_confidence_levels() -> None:
+@pytest.mark.parametrize("confidence", ["high", "medium", "low"])
+def test_rule_proposal_confidence_levels(confidence: str) -> None:
     """Test RuleProposal with different confidence levels."""
-    high = RuleProposal(
-        cluster_hash="high123",
-        cluster_size=10,
-        sample_descriptions="[]",
-        llm_confidence="high",
-    )
-    assert high.llm_confidence == "high"
-
-    medium = RuleProposal(
-        cluster_hash="medium123",
+    proposal = RuleProposal(
+        cluster_hash=f"{confidence}123",
         cluster_size=10,
         sample_descriptions="[]",
-        llm_confidence="medium",
+        llm_confidence=confidence,
     )
-    assert medium.llm_confidence == "medium"
 
-    low = RuleProposal(
-        cluster_hash="low123",
-        cluster_size=10,
-        sample_descriptions="[]",
-        llm_confidence="low",
-    )
-    assert low.llm_confidence == "low"
+    assert proposal.llm_confidence == confidence
@@ -16,39 +16,38 @@ from finance_api.repositories.email_account_repository import EmailAccountReposi
 
 
 @pytest.fixture
-def test_category(db_session: Session) -> Category:
-    """Create a test category."""
-    category = Category(name="Electronics")
-    db_session.add(category)
-    db_session.flush()
+def db_session(shared_db_session: Session) -> Session:
+    """Run each test in a SAVEPOINT instead of a freshly created database."""
+    return shared_db_session
+
+
+def create_category(session: Session, name: str) -> Category:
+    """Create a root category with its closure table self-reference."""
+    category = Category(name=name)
+    session.add(category)
+    session.flush()
 
     closure = CategoryClosure(
         ancestor_id=category.id,
         descendant_id=category.id,
         depth=0,
     )
-    db_session.add(closure)
-    db_session.flush()
+    session.add(closure)
+    session.flush()
 
     return category
 
 
-@pytest.fixture
-def test_category_2(db_session: Session) -> Category:
-    """Create a second test category."""
-    category = Category(name="Books")
-    db_session.add(category)
-    db_session.flush()
+@pytest.fixture(scope="class")
+def test_category(fixture_session: Session) -> Category:
+    """Create a test category shared by every test in a class."""
+    return create_category(fixture_session, "Electronics")
 
-    closure = CategoryClosure(
-        ancestor_id=category.id,
-        descendant_id=category.id,
-        depth=0,
-    )
-    db_session.add(closure)
-    db_session.flush()
 
-    return category
+@pytest.fixture(scope="class")
+def test_category_2(fixture_session: Session) -> Category:
+    """Create a second test category shared by every test in a class."""
+    return create_category(fixture_session, "Books")
 
 
 @pytest.fixture
@@ -84,7 +83,6 @@ class TestCategoryEvidenceRepositoryCreate:
             category_id=test_category.id,
             evidence_type="email",
         )
-        db_session.flush()
 
         assert evidence.id is not None
         assert evidence.transaction_id == test_transaction.id
@@ -105,7 +103,6 @@ class TestCategoryEvidenceRepositoryCreate:
             email_address="test@example.com",
             provider="gmail",
         )
-        db_session.flush()
 
         repo = CategoryEvidenceRepository(db_session)
         email_time = datetime(2026, 1, 10, 10, 30, 0)
@@ -121,7 +118,6 @@ class TestCategoryEvidenceRepositoryCreate:
             email_datetime=email_time,
             evidence_summary="Order confirmation from Amazon",
         )
-        db_session.flush()
 
         assert evidence.email_account_id == email_account.id
         assert evidence.email_message_id == "<msg123@amazon.co.uk>"
@@ -147,7 +143,6 @@ class TestCategoryEvidenceRepositoryCreate:
             model_used="claude-sonnet-4-5-20250514",
             raw_extraction='{"items": [{"name": "Python Book"}]}',
         )
-        db_session.flush()
 
         assert evidence.confidence_score == Decimal("0.95")
         assert evidence.model_used == "claude-sonnet-4-5-20250514"
@@ -192,12 +187,19 @@ class TestCategoryEvidenceRepositoryCreateBatch:
         ]
 
         created = repo.create_batch(evidence_list)
-        db_session.flush()
 
         assert len(created) == 3
         assert created[0].item_description == "USB Cable"
         assert created[1].item_description == "Programming Book"
         assert created[2].item_description == "Shipping"
+        assert all(evidence.id is not None for evidence in created)
+        assert all(evidence.item_currency == "GBP" for evidence in created)
+
+    def test_create_empty_batch(self, db_session: Session) -> None:
+        """Test that an empty batch creates nothing."""
+        repo = CategoryEvidenceRepository(db_session)
+
+        assert repo.create_batch([]) == []
 
 
 class TestCategoryEvidenceRepositoryGet:
@@ -218,7 +220,6 @@ class TestCategoryEvidenceRepositoryGet:
             category_id=test_category.id,
             evidence_type="rule",
         )
-        db_session.flush()
 
         evidence = repo.get(created.id)
 
@@ -244,21 +245,24 @@ class TestCategoryEvidenceRepositoryGetByTransaction:
         """Test getting all evidence for a transaction."""
         repo = CategoryEvidenceRepository(db_session)
 
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Item 1",
-            item_price=Decimal("10.00"),
-            category_id=test_category.id,
-            evidence_type="email",
+        repo.create_batch(
+            [
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Item 1",
+                    "item_price": Decimal("10.00"),
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Item 2",
+                    "item_price": Decimal("20.00"),
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+            ]
         )
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Item 2",
-            item_price=Decimal("20.00"),
-            category_id=test_category.id,
-            evidence_type="email",
-        )
-        db_session.flush()
 
         evidence_list = repo.get_by_transaction(test_transaction.id)
 
@@ -287,22 +291,25 @@ class TestCategoryEvidenceRepositoryGetTransactionTotal:
         """Test calculating total of evidence items."""
         repo = CategoryEvidenceRepository(db_session)
 
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Item 1",
-            item_price=Decimal("10.00"),
-            item_quantity=2,
-            category_id=test_category.id,
-            evidence_type="email",
-        )
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Item 2",
-            item_price=Decimal("25.00"),
-            category_id=test_category.id,
-            evidence_type="email",
+        repo.create_batch(
+            [
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Item 1",
+                    "item_price": Decimal("10.00"),
+                    "item_quantity": 2,
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Item 2",
+                    "item_price": Decimal("25.00"),
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+            ]
         )
-        db_session.flush()
 
         total = repo.get_transaction_total(test_transaction.id)
 
@@ -333,30 +340,33 @@ class TestCategoryEvidenceRepositoryGetDominantCategory:
         """Test finding category with highest total value."""
         repo = CategoryEvidenceRepository(db_session)
 
-        # Electronics: 10 + 5 = 15
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Cable",
-            item_price=Decimal("10.00"),
-            category_id=test_category.id,
-            evidence_type="email",
+        repo.create_batch(
+            [
+                # Electronics: 10 + 5 = 15
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Cable",
+                    "item_price": Decimal("10.00"),
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Adapter",
+                    "item_price": Decimal("5.00"),
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+                # Books: 30
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Book",
+                    "item_price": Decimal("30.00"),
+                    "category_id": test_category_2.id,
+                    "evidence_type": "email",
+                },
+            ]
         )
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Adapter",
-            item_price=Decimal("5.00"),
-            category_id=test_category.id,
-            evidence_type="email",
-        )
-        # Books: 30
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Book",
-            item_price=Decimal("30.00"),
-            category_id=test_category_2.id,
-            evidence_type="email",
-        )
-        db_session.flush()
 
         dominant = repo.get_dominant_category(test_transaction.id)
 
@@ -385,21 +395,24 @@ class TestCategoryEvidenceRepositoryDelete:
         """Test deleting all evidence for a transaction."""
         repo = CategoryEvidenceRepository(db_session)
 
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Item 1",
-            item_price=Decimal("10.00"),
-            category_id=test_category.id,
-            evidence_type="email",
+        repo.create_batch(
+            [
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Item 1",
+                    "item_price": Decimal("10.00"),
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+                {
+                    "transaction_id": test_transaction.id,
+                    "item_description": "Item 2",
+                    "item_price": Decimal("20.00"),
+                    "category_id": test_category.id,
+                    "evidence_type": "email",
+                },
+            ]
         )
-        repo.create(
-            transaction_id=test_transaction.id,
-            item_description="Item 2",
-            item_price=Decimal("20.00"),
-            category_id=test_category.id,
-            evidence_type="email",
-        )
-        db_session.flush()
 
         deleted_count = repo.delete_by_transaction(test_transaction.id)
         db_session.flush()
@@ -422,7 +435,6 @@ class TestCategoryEvidenceRepositoryDelete:
             category_id=test_category.id,
             evidence_type="manual",
         )
-        db_session.flush()
         evidence_id = evidence.id
 
         repo.delete(evidence_id)
@@ -84,6 +84,46 @@ class TestClassificationRuleRepositoryCreate:
         assert rule.requires_disambiguation is True
 
 
+class TestClassificationRuleRepositoryCreateBatch:
+    """Tests for ClassificationRuleRepository.create_batch()."""
+
+    def test_create_batch_of_rules(
+        self, db_session: Session, test_category: Category
+    ) -> None:
+        """Test creating several rules at once."""
+        repo = ClassificationRuleRepository(db_session)
+
+        rules = repo.create_batch(
+            [
+                {
+                    "name": "Tesco",
+                    "rule_expression": 'description =~ "(?i)tesco"',
+                    "category_id": test_category.id,
+                    "priority": 10,
+                },
+                {
+                    "name": "Amazon",
+                    "rule_expression": 'description =~ "(?i)amazon"',
+                    "category_id": test_category.id,
+                    "requires_disambiguation": True,
+                },
+            ]
+        )
+
+        assert [rule.name for rule in rules] == ["Tesco", "Amazon"]
+        assert all(rule.id is not None for rule in rules)
+        assert all(rule.is_active is True for rule in rules)
+        assert rules[0].priority == 10
+        assert rules[1].priority == 0
+        assert rules[1].requires_disambiguation is True
+
+    def test_create_empty_batch(self, db_session: Session) -> None:
+        """Test that an empty batch creates nothing."""
+        repo = ClassificationRuleRepository(db_session)
+
+        assert repo.create_batch([]) == []
+
+
 class TestClassificationRuleRepositoryGet:
     """Tests for ClassificationRuleRepository.get()."""
 
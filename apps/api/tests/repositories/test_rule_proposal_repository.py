@@ -2,6 +2,7 @@
 
 import json
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -247,6 +248,35 @@ class TestRuleProposalRepositoryGetByClusterHash:
         dup_proposals = [p for p in all_proposals if p.cluster_hash == "dup_hash"]
         assert len(dup_proposals) == 1
 
+    def test_repeat_lookup_skips_query(self, db_session: Session) -> None:
+        """Test that known cluster hashes are resolved without a query."""
+        repo = RuleProposalRepository(db_session)
+        created = repo.create(
+            cluster_hash="cached_hash",
+            cluster_size=10,
+            sample_descriptions="[]",
+        )
+
+        with patch.object(db_session, "execute", wraps=db_session.execute) as spy:
+            found = repo.get_by_cluster_hash("cached_hash")
+
+        assert found is created
+        spy.assert_not_called()
+
+    def test_lookup_after_delete_returns_none(self, db_session: Session) -> None:
+        """Test that deleting a proposal drops its cluster hash."""
+        repo = RuleProposalRepository(db_session)
+        proposal = repo.create(
+            cluster_hash="deleted_hash",
+            cluster_size=10,
+            sample_descriptions="[]",
+        )
+
+        repo.delete(proposal.id)
+        db_session.flush()
+
+        assert repo.get_by_cluster_hash("deleted_hash") is None
+
 
 class TestRuleProposalRepositoryUpdateStatus:
     """Tests for RuleProposalRepository.update_status()."""
@@ -2,9 +2,10 @@
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
+from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 
 from finance_api.models.category import Category, CategoryClosure
@@ -268,6 +269,28 @@ class TestClassificationOrchestratorRulesOnly:
         assert result.method == "existing"
         assert result.category_id == groceries_category.id
 
+    def test_idempotency_with_known_existing_category(
+        self,
+        rules_service: RulesClassificationService,
+        evidence_repo: CategoryEvidenceRepository,
+        groceries_category: Category,
+        tesco_transaction: Transaction,
+    ) -> None:
+        """Test that a caller-supplied existing category skips classification."""
+        orchestrator = ClassificationOrchestrator(
+            rules_service=rules_service,
+            disambiguation_service=None,
+            evidence_repository=evidence_repo,
+        )
+
+        result = orchestrator.classify(
+            tesco_transaction, existing_category_id=groceries_category.id
+        )
+
+        assert result.classified is True
+        assert result.method == "existing"
+        assert result.category_id == groceries_category.id
+
     def test_force_reclassification(
         self,
         db_session: Session,
@@ -506,6 +529,235 @@ class TestClassificationOrchestratorBatch:
         assert results[amazon_transaction.id].classified is True
         assert results[unknown_transaction.id].classified is False
 
+    def test_classify_batch_assigns_categories_in_one_call(
+        self,
+        db_session: Session,
+        rules_service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        evidence_repo: CategoryEvidenceRepository,
+        groceries_category: Category,
+        electronics_category: Category,
+        tesco_transaction: Transaction,
+        amazon_transaction: Transaction,
+        unknown_transaction: Transaction,
+    ) -> None:
+        """Test that a batch updater receives every assignment at once."""
+        rule_repo.create(
+            name="Tesco",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+        )
+        rule_repo.create(
+            name="Amazon",
+            rule_expression='description =~ "(?i)amazon"',
+            category_id=electronics_category.id,
+        )
+        db_session.flush()
+        rules_service.reload_rules()
+
+        category_updater = MagicMock()
+        batch_updater = MagicMock()
+
+        orchestrator = ClassificationOrchestrator(
+            rules_service=rules_service,
+            disambiguation_service=None,
+            evidence_repository=evidence_repo,
+            transaction_category_updater=category_updater,
+            transaction_category_batch_updater=batch_updater,
+        )
+
+        orchestrator.classify_batch(
+            [tesco_transaction, amazon_transaction, unknown_transaction]
+        )
+
+        batch_updater.assert_called_once_with(
+            [
+                (tesco_transaction.id, groceries_category.id),
+                (amazon_transaction.id, electronics_category.id),
+            ]
+        )
+        category_updater.assert_not_called()
+
+        # Single classifications still go through the per-transaction updater
+        orchestrator.classify(tesco_transaction, force=True)
+        category_updater.assert_called_once_with(
+            tesco_transaction.id, groceries_category.id
+        )
+
+    def test_batch_updater_used_for_single_classification(
+        self,
+        db_session: Session,
+        rules_service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        evidence_repo: CategoryEvidenceRepository,
+        groceries_category: Category,
+        tesco_transaction: Transaction,
+    ) -> None:
+        """Test that classify() uses the batch updater when it is the only one."""
+        rule_repo.create(
+            name="Tesco",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+        )
+        db_session.flush()
+        rules_service.reload_rules()
+
+        batch_updater = MagicMock()
+
+        orchestrator = ClassificationOrchestrator(
+            rules_service=rules_service,
+            disambiguation_service=None,
+            evidence_repository=evidence_repo,
+            transaction_category_batch_updater=batch_updater,
+        )
+
+        orchestrator.classify(tesco_transaction)
+
+        batch_updater.assert_called_once_with(
+            [(tesco_transaction.id, groceries_category.id)]
+        )
+
+    def test_batch_updater_used_for_background_disambiguation(
+        self,
+        db_session: Session,
+        rules_service: RulesClassificationService,
+        evidence_repo: CategoryEvidenceRepository,
+        electronics_category: Category,
+        unknown_transaction: Transaction,
+    ) -> None:
+        """Test that background disambiguation uses the batch updater."""
+        rules_service.reload_rules()
+
+        mock_disambiguation = MagicMock()
+        mock_disambiguation.disambiguate.return_value = DisambiguationResult(
+            transaction_id=unknown_transaction.id,
+            success=True,
+            dominant_category_id=electronics_category.id,
+            evidence_records=[],
+            confidence_score=Decimal("0.85"),
+        )
+        batch_updater = MagicMock()
+
+        orchestrator = ClassificationOrchestrator(
+            rules_service=rules_service,
+            disambiguation_service=mock_disambiguation,
+            evidence_repository=evidence_repo,
+            transaction_category_batch_updater=batch_updater,
+        )
+
+        background_tasks = BackgroundTasks()
+        result = orchestrator.classify(
+            unknown_transaction, background_tasks=background_tasks
+        )
+        assert result.method == "pending"
+        batch_updater.assert_not_called()
+
+        task = background_tasks.tasks[0]
+        task.func(*task.args, **task.kwargs)
+
+        batch_updater.assert_called_once_with(
+            [(unknown_transaction.id, electronics_category.id)]
+        )
+
+    def test_classify_batch_keeps_assignments_made_before_an_error(
+        self,
+        db_session: Session,
+        rules_service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        evidence_repo: CategoryEvidenceRepository,
+        groceries_category: Category,
+        electronics_category: Category,
+        tesco_transaction: Transaction,
+        amazon_transaction: Transaction,
+    ) -> None:
+        """Test that assignments collected before a failure are still made."""
+        rule_repo.create(
+            name="Tesco",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+        )
+        rule_repo.create(
+            name="Amazon",
+            rule_expression='description =~ "(?i)amazon"',
+            category_id=electronics_category.id,
+            requires_disambiguation=True,
+        )
+        db_session.flush()
+        rules_service.reload_rules()
+
+        mock_disambiguation = MagicMock()
+        mock_disambiguation.disambiguate.side_effect = RuntimeError("API down")
+        batch_updater = MagicMock()
+
+        orchestrator = ClassificationOrchestrator(
+            rules_service=rules_service,
+            disambiguation_service=mock_disambiguation,
+            evidence_repository=evidence_repo,
+            transaction_category_batch_updater=batch_updater,
+        )
+
+        with pytest.raises(RuntimeError):
+            orchestrator.classify_batch([tesco_transaction, amazon_transaction])
+
+        batch_updater.assert_called_once_with(
+            [(tesco_transaction.id, groceries_category.id)]
+        )
+
+    def test_classify_during_batch_assigns_immediately(
+        self,
+        db_session: Session,
+        rules_service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        evidence_repo: CategoryEvidenceRepository,
+        groceries_category: Category,
+        electronics_category: Category,
+        tesco_transaction: Transaction,
+        amazon_transaction: Transaction,
+    ) -> None:
+        """Test that classify() on a shared orchestrator ignores a running batch."""
+        rule_repo.create(
+            name="Tesco",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+        )
+        rule_repo.create(
+            name="Amazon",
+            rule_expression='description =~ "(?i)amazon"',
+            category_id=electronics_category.id,
+            requires_disambiguation=True,
+        )
+        db_session.flush()
+        rules_service.reload_rules()
+
+        batch_updater = MagicMock()
+        mock_disambiguation = MagicMock()
+        orchestrator = ClassificationOrchestrator(
+            rules_service=rules_service,
+            disambiguation_service=mock_disambiguation,
+            evidence_repository=evidence_repo,
+            transaction_category_batch_updater=batch_updater,
+        )
+
+        def disambiguate(transaction: Transaction) -> DisambiguationResult:
+            # Another caller classifies while the batch is still running
+            orchestrator.classify(tesco_transaction)
+            return DisambiguationResult(
+                transaction_id=transaction.id,
+                success=True,
+                dominant_category_id=electronics_category.id,
+                evidence_records=[],
+                confidence_score=Decimal("0.95"),
+            )
+
+        mock_disambiguation.disambiguate.side_effect = disambiguate
+
+        orchestrator.classify_batch([amazon_transaction])
+
+        assert batch_updater.call_args_list == [
+            call([(tesco_transaction.id, groceries_category.id)]),
+            call([(amazon_transaction.id, electronics_category.id)]),
+        ]
+
 
 class TestClassificationOrchestratorStatistics:
     """Tests for classification statistics."""
@@ -545,3 +797,39 @@ class TestClassificationOrchestratorStatistics:
         assert stats["classified"] == 1
         assert stats["unclassified"] == 2
         assert stats["by_rule"] == 1
+
+    def test_classify_batch_with_statistics(
+        self,
+        db_session: Session,
+        rules_service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        evidence_repo: CategoryEvidenceRepository,
+        groceries_category: Category,
+        tesco_transaction: Transaction,
+        amazon_transaction: Transaction,
+        unknown_transaction: Transaction,
+    ) -> None:
+        """Test that fused statistics match a separate statistics pass."""
+        rule_repo.create(
+            name="Tesco",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+        )
+        db_session.flush()
+        rules_service.reload_rules()
+
+        orchestrator = ClassificationOrchestrator(
+            rules_service=rules_service,
+            disambiguation_service=None,
+            evidence_repository=evidence_repo,
+        )
+
+        results, stats = orchestrator.classify_batch_with_statistics(
+            [tesco_transaction, amazon_transaction, unknown_transaction]
+        )
+
+        assert len(results) == 3
+        assert stats == orchestrator.get_classification_statistics(results)
+        assert stats["total"] == 3
+        assert stats["classified"] == 1
+        assert stats["by_rule"] == 1
@@ -1,7 +1,7 @@
 """Tests for RuleDiscoveryService."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -204,6 +204,35 @@ class TestProposeRule:
         assert result.confidence == "high"
         assert "Tesco" in result.reasoning
 
+    @patch("finance_api.services.rule_discovery_service.Anthropic")
+    def test_proposes_rule_from_tool_use(self, mock_anthropic_class: MagicMock) -> None:
+        """Test that a tool_use answer is read without JSON parsing."""
+        tool_input = {
+            "pattern": "(?i)tesco",
+            "category_name": "Groceries",
+            "confidence": "high",
+            "reasoning": "All transactions are from Tesco supermarket",
+        }
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(type="tool_use", input=tool_input)]
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value = mock_response
+        mock_anthropic_class.return_value = mock_client
+
+        service = RuleDiscoveryService()
+        cluster = create_mock_cluster("TESCO", ["TESCO STORES 1234"])
+        categories = [create_mock_category(1, "Groceries")]
+
+        result = service.propose_rule(cluster, categories)
+
+        assert result.pattern == "(?i)tesco"
+        assert result.category_name == "Groceries"
+        assert json.loads(result.raw_response) == tool_input
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        assert call_kwargs["tool_choice"] == {"type": "tool", "name": "propose_rule"}
+        # The tool schema defines the answer format, not the prompt
+        assert "JSON" not in call_kwargs["messages"][0]["content"]
+
     @patch("finance_api.services.rule_discovery_service.Anthropic")
     def test_handles_api_error(self, mock_anthropic_class: MagicMock) -> None:
         """Test handling of API error."""
@@ -348,6 +377,108 @@ class TestProposeRulesBatch:
         assert isinstance(results[1], RuleDiscoveryError)
 
 
+class TestProposeRulesBatchAsync:
+    """Tests for async batch rule proposal."""
+
+    async def test_proposes_rules_concurrently(self) -> None:
+        """Test async batch returns results in cluster order."""
+
+        def make_response(pattern: str) -> MagicMock:
+            response = MagicMock()
+            response.content = [
+                MagicMock(
+                    type="tool_use",
+                    input={
+                        "pattern": pattern,
+                        "category_name": "Test",
+                        "confidence": "high",
+                        "reasoning": "Test",
+                    },
+                )
+            ]
+            return response
+
+        async_client = MagicMock()
+        async_client.messages.create = AsyncMock(
+            side_effect=[make_response("(?i)a"), make_response("(?i)b")]
+        )
+        with patch("finance_api.services.rule_discovery_service.Anthropic"):
+            service = RuleDiscoveryService(async_client=async_client, max_concurrency=2)
+        clusters = [
+            create_mock_cluster("A", ["A1"]),
+            create_mock_cluster("B", ["B1"]),
+        ]
+        categories = [create_mock_category(1, "Test")]
+
+        results = await service.propose_rules_batch_async(clusters, categories)
+
+        assert [r.pattern for r in results] == ["(?i)a", "(?i)b"]
+        assert async_client.messages.create.await_count == 2
+
+    async def test_captures_errors_per_cluster(self) -> None:
+        """Test that a failing cluster yields an error without stopping others."""
+        success = MagicMock()
+        success.content = [
+            MagicMock(
+                text=json.dumps(
+                    {
+                        "pattern": "(?i)test",
+                        "category_name": "Test",
+                        "confidence": "high",
+                        "reasoning": "Test",
+                    }
+                )
+            )
+        ]
+        async_client = MagicMock()
+        async_client.messages.create = AsyncMock(
+            side_effect=[success, Exception("API error")]
+        )
+        with patch("finance_api.services.rule_discovery_service.Anthropic"):
+            service = RuleDiscoveryService(async_client=async_client)
+        clusters = [
+            create_mock_cluster("A", ["A1"]),
+            create_mock_cluster("B", ["B1"]),
+        ]
+        categories = [create_mock_category(1, "Test")]
+
+        results = await service.propose_rules_batch_async(clusters, categories)
+
+        assert len(results) == 2
+        assert not isinstance(results[0], RuleDiscoveryError)
+        assert isinstance(results[1], RuleDiscoveryError)
+
+    async def test_uses_injected_sync_client(self) -> None:
+        """Test that an injected client also serves the async methods."""
+        response = MagicMock()
+        response.content = [
+            MagicMock(
+                type="tool_use",
+                input={
+                    "pattern": "(?i)a",
+                    "category_name": "Test",
+                    "confidence": "high",
+                    "reasoning": "Test",
+                },
+            )
+        ]
+        client = MagicMock()
+        client.messages.create.return_value = response
+
+        with patch(
+            "finance_api.services.rule_discovery_service.AsyncAnthropic"
+        ) as mock_async_anthropic_class:
+            service = RuleDiscoveryService(client=client)
+            results = await service.propose_rules_batch_async(
+                [create_mock_cluster("A", ["A1"])],
+                [create_mock_category(1, "Test")],
+            )
+
+        assert [r.pattern for r in results] == ["(?i)a"]
+        client.messages.create.assert_called_once()
+        mock_async_anthropic_class.assert_not_called()
+
+
 class TestModelProperty:
     """Tests for model property."""
 
@@ -362,6 +493,25 @@ class TestModelProperty:
 class TestConfiguration:
     """Tests for service configuration."""
 
+    def test_uses_injected_client(self) -> None:
+        """Test that an injected client is used instead of creating one."""
+        client = MagicMock()
+        with patch(
+            "finance_api.services.rule_discovery_service.Anthropic"
+        ) as mock_anthropic_class:
+            service = RuleDiscoveryService(client=client)
+
+        assert service._client is client
+        mock_anthropic_class.assert_not_called()
+
+    def test_rejects_non_positive_max_concurrency(self) -> None:
+        """Test that max_concurrency below 1 is rejected up front."""
+        with patch("finance_api.services.rule_discovery_service.Anthropic"):
+            with pytest.raises(ValueError, match="max_concurrency"):
+                RuleDiscoveryService(max_concurrency=0)
+            with pytest.raises(ValueError, match="max_concurrency"):
+                RuleDiscoveryService(max_concurrency=-1)
+
     def test_default_temperature(self) -> None:
         """Test default temperature is deterministic."""
         with patch("finance_api.services.rule_discovery_service.Anthropic"):
@@ -1,13 +1,15 @@
 """Tests for RuleValidationService."""
 
+import re
 from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from finance_api.models.classification_rule import ClassificationRule
 from finance_api.models.transaction import Transaction
 from finance_api.services.rule_validation_service import (
     RuleValidationService,
+    _compile,
 )
 
 
@@ -97,6 +99,19 @@ class TestTestRule:
         # Precision = 2/3 = 0.6667
         assert result.precision == Decimal("0.6667")
 
+    def test_accepts_frozenset_cluster_ids(self) -> None:
+        """Test that cluster IDs can be passed as a frozenset."""
+        service = RuleValidationService()
+        transactions = [
+            create_mock_transaction(1, "TESCO STORES"),
+            create_mock_transaction(2, "TESCO BANK"),
+        ]
+
+        result = service.test_rule(r"(?i)tesco", transactions, frozenset({1}))
+
+        assert result.true_positives == 1
+        assert result.false_positives == 1
+
     def test_partial_coverage(self) -> None:
         """Test rule with partial coverage."""
         service = RuleValidationService()
@@ -124,6 +139,52 @@ class TestTestRule:
         assert result.regex_error is not None
         assert result.total_matches == 0
 
+    def test_compiles_repeated_pattern_once(self) -> None:
+        """Test that repeated validation reuses the compiled pattern."""
+        service = RuleValidationService()
+        transactions = [create_mock_transaction(1, "TESCO")]
+        _compile.cache_clear()
+
+        with patch(
+            "finance_api.services.rule_validation_service.re.compile",
+            wraps=re.compile,
+        ) as compile_spy:
+            first = service.test_rule(r"(?i)tesco", transactions, {1})
+            second = service.test_rule(r"(?i)tesco", transactions, {1})
+
+        assert compile_spy.call_count == 1
+        assert first.true_positives == second.true_positives == 1
+
+    def test_literal_alternation_matches_like_regex(self) -> None:
+        """Test that plain-text patterns match the same descriptions as the regex."""
+        service = RuleValidationService()
+        transactions = [
+            create_mock_transaction(1, "TESCO STORES 1234"),
+            create_mock_transaction(2, "Sainsburys Local"),
+            create_mock_transaction(3, "STORE CAFÉ"),
+            create_mock_transaction(4, "LOCAL CAFÉ"),
+            create_mock_transaction(5, "ASDA"),
+        ]
+
+        result = service.test_rule(r"(?i)stores|local", transactions, {1})
+
+        assert result.true_positives == 1
+        assert result.false_positives == 2
+        assert result.sample_false_positives == ["Sainsburys Local", "LOCAL CAFÉ"]
+
+    def test_case_sensitive_literal_pattern(self) -> None:
+        """Test that literal patterns without (?i) stay case sensitive."""
+        service = RuleValidationService()
+        transactions = [
+            create_mock_transaction(1, "TESCO"),
+            create_mock_transaction(2, "tesco"),
+        ]
+
+        result = service.test_rule(r"TESCO", transactions, {1, 2})
+
+        assert result.true_positives == 1
+        assert result.coverage == Decimal("0.5000")
+
     def test_no_matches(self) -> None:
         """Test rule that matches nothing."""
         service = RuleValidationService()
@@ -208,6 +269,20 @@ class TestCalculatePrecision:
 
         assert precision == Decimal("0.7500")
 
+    def test_rounds_half_to_even(self) -> None:
+        """Test that ties round half-even at four decimal places."""
+        service = RuleValidationService()
+
+        # 1/160 = 0.00625 and 3/160 = 0.01875
+        assert str(service.calculate_precision(1, 159)) == "0.0062"
+        assert str(service.calculate_precision(3, 157)) == "0.0188"
+
+    def test_repeating_fraction(self) -> None:
+        """Test that repeating fractions are rounded to four places."""
+        service = RuleValidationService()
+
+        assert str(service.calculate_precision(2, 1)) == "0.6667"
+
     def test_no_matches_returns_zero(self) -> None:
         """Test that no matches returns zero precision."""
         service = RuleValidationService()
@@ -323,6 +398,26 @@ class TestFindConflicts:
         assert len(result.conflicting_rules) == 1
         assert result.overlap_counts[1] == 2
 
+    def test_overlap_counts_only_new_matches(self) -> None:
+        """Test that overlap counts only transactions matching the new pattern."""
+        mock_repo = MagicMock()
+        existing_rule = MagicMock(spec=ClassificationRule)
+        existing_rule.id = 1
+        existing_rule.rule_expression = 'description =~ "(?i)tesco"'
+        mock_repo.get_active_by_priority.return_value = [existing_rule]
+
+        service = RuleValidationService(rule_repository=mock_repo)
+        transactions = [
+            create_mock_transaction(1, "TESCO EXPRESS"),
+            create_mock_transaction(2, "TESCO STORES"),
+            create_mock_transaction(3, "TESCO BANK"),
+        ]
+
+        result = service.find_conflicts(r"(?i)express|bank", transactions)
+
+        assert result.has_conflicts is True
+        assert result.overlap_counts[1] == 2
+
     def test_no_overlap(self) -> None:
         """Test no conflict when rules don't overlap."""
         mock_repo = MagicMock()
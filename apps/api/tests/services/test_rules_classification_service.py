@@ -2,6 +2,7 @@
 
 from datetime import date
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -13,6 +14,7 @@ from finance_api.repositories.classification_rule_repository import (
 )
 from finance_api.services.rules_classification_service import (
     RulesClassificationService,
+    extract_literal_alternatives,
 )
 
 
@@ -467,6 +469,289 @@ class TestRulesClassificationServiceBatch:
         assert results[txn2.id].category_id == online_shopping_category.id
         assert results[txn3.id] is None
 
+    def test_classify_batch_matches_single_classify(
+        self,
+        service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        mortgage_category: Category,
+        db_session: Session,
+    ) -> None:
+        """Test that batch results agree with per-transaction classification."""
+        rule_repo.create(
+            name="Joint Account Mortgage",
+            rule_expression='account_name == "Joint Account" and amount < -1000',
+            category_id=mortgage_category.id,
+        )
+        db_session.flush()
+        service.reload_rules()
+
+        joint_txn = Transaction(
+            transaction_date=date(2026, 1, 15),
+            description="MORTGAGE PAYMENT",
+            amount=Decimal("-1500.00"),
+            currency="GBP",
+            account_name="Joint Account",
+        )
+        personal_txn = Transaction(
+            transaction_date=date(2026, 1, 16),
+            description="MORTGAGE PAYMENT",
+            amount=Decimal("-1500.00"),
+            currency="GBP",
+        )
+        small_txn = Transaction(
+            transaction_date=date(2026, 1, 17),
+            description="MORTGAGE FEE",
+            amount=Decimal("-25.00"),
+            currency="GBP",
+            account_name="Joint Account",
+        )
+        transactions = [joint_txn, personal_txn, small_txn]
+        db_session.add_all(transactions)
+        db_session.flush()
+
+        results = service.classify_batch(transactions)
+
+        assert results[joint_txn.id] is not None
+        assert results[joint_txn.id].category_id == mortgage_category.id
+        assert results[personal_txn.id] is None
+        assert results[small_txn.id] is None
+        for txn in transactions:
+            single = service.classify(txn)
+            batch = results[txn.id]
+            assert (single is None) == (batch is None)
+
+    def test_classify_batch_matches_each_description_once(
+        self,
+        service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        groceries_category: Category,
+        db_session: Session,
+    ) -> None:
+        """Test that repeated descriptions are matched once per batch."""
+        rule_repo.create(
+            name="Groceries",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+        )
+        db_session.flush()
+        service.reload_rules()
+
+        transactions = [
+            Transaction(
+                transaction_date=date(2026, 1, day),
+                description=description,
+                amount=Decimal("-10.00"),
+                currency="GBP",
+            )
+            for day, description in enumerate(
+                ["TESCO STORES", "UNKNOWN", "TESCO STORES", "UNKNOWN", "TESCO STORES"],
+                start=1,
+            )
+        ]
+        db_session.add_all(transactions)
+        db_session.flush()
+
+        with patch.object(
+            service, "_match_transaction", wraps=service._match_transaction
+        ) as match_transaction:
+            results = service.classify_batch(transactions)
+
+        assert match_transaction.call_count == 2
+        assert len(results) == 5
+        for txn in transactions:
+            if txn.description == "TESCO STORES":
+                assert results[txn.id] is not None
+                assert results[txn.id].category_id == groceries_category.id
+            else:
+                assert results[txn.id] is None
+
+
+class TestRulesClassificationServicePrefilter:
+    """Tests for the literal anchor pre-filter."""
+
+    def test_extract_literal_alternatives_simple(self) -> None:
+        """Test extracting anchors from a case-insensitive literal."""
+        assert extract_literal_alternatives("(?i)TESCO") == (("tesco",), True)
+
+    def test_extract_literal_alternatives_alternation(self) -> None:
+        """Test extracting anchors from a grouped alternation."""
+        assert extract_literal_alternatives("(?i)(tesco|british gas)") == (
+            ("tesco", "british gas"),
+            True,
+        )
+
+    def test_extract_literal_alternatives_case_sensitive(self) -> None:
+        """Test that anchors keep their case without the (?i) flag."""
+        assert extract_literal_alternatives("TESCO|Asda") == (
+            ("TESCO", "Asda"),
+            False,
+        )
+
+    def test_extract_literal_alternatives_rejects_regex_syntax(self) -> None:
+        """Test that patterns with regex operators get no anchors."""
+        assert extract_literal_alternatives("(?i)amaz?on") is None
+        assert extract_literal_alternatives("(?i)tesco.*extra") is None
+        assert extract_literal_alternatives("(?i)tesco|") is None
+        assert extract_literal_alternatives("(?i)\\btesco\\b") is None
+
+    def test_prefilter_with_compound_expression(
+        self,
+        service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        groceries_category: Category,
+        db_session: Session,
+    ) -> None:
+        """Test that anchors from one side of an `and` still classify correctly."""
+        rule_repo.create(
+            name="Large Tesco Shop",
+            rule_expression='description =~ "(?i)tesco" and amount < -100',
+            category_id=groceries_category.id,
+        )
+        db_session.flush()
+        service.reload_rules()
+
+        large_txn = Transaction(
+            transaction_date=date(2026, 1, 15),
+            description="TESCO EXTRA",
+            amount=Decimal("-150.00"),
+            currency="GBP",
+        )
+        other_txn = Transaction(
+            transaction_date=date(2026, 1, 15),
+            description="ASDA SUPERSTORE",
+            amount=Decimal("-150.00"),
+            currency="GBP",
+        )
+        db_session.add_all([large_txn, other_txn])
+        db_session.flush()
+
+        large_result = service.classify(large_txn)
+
+        assert large_result is not None
+        assert large_result.category_id == groceries_category.id
+        assert service.classify(other_txn) is None
+
+    def test_match_operator_requires_prefix(
+        self,
+        service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        groceries_category: Category,
+        online_shopping_category: Category,
+        db_session: Session,
+    ) -> None:
+        """Test that =~ only matches at the start while =~~ searches anywhere."""
+        rule_repo.create(
+            name="Tesco Prefix",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+            priority=0,
+        )
+        rule_repo.create(
+            name="Tesco Anywhere",
+            rule_expression='description =~~ "(?i)tesco"',
+            category_id=online_shopping_category.id,
+            priority=1,
+        )
+        db_session.flush()
+        service.reload_rules()
+
+        prefix_txn = Transaction(
+            transaction_date=date(2026, 1, 15),
+            description="TESCO STORES",
+            amount=Decimal("-45.00"),
+            currency="GBP",
+        )
+        embedded_txn = Transaction(
+            transaction_date=date(2026, 1, 15),
+            description="CARD PAYMENT TESCO",
+            amount=Decimal("-45.00"),
+            currency="GBP",
+        )
+        db_session.add_all([prefix_txn, embedded_txn])
+        db_session.flush()
+
+        results = service.classify_batch([prefix_txn, embedded_txn])
+
+        assert results[prefix_txn.id] is not None
+        assert results[prefix_txn.id].category_id == groceries_category.id
+        assert results[embedded_txn.id] is not None
+        assert results[embedded_txn.id].category_id == online_shopping_category.id
+
+    def test_prefilter_skipped_for_non_ascii_description(
+        self,
+        service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        groceries_category: Category,
+        db_session: Session,
+    ) -> None:
+        """Test that regex case folding still applies to non-ASCII text."""
+        rule_repo.create(
+            name="Tesco",
+            rule_expression='description =~ "(?i)tesco"',
+            category_id=groceries_category.id,
+        )
+        db_session.flush()
+        service.reload_rules()
+
+        # "\u017f" (long s) case-folds to "s" in regex but not via str.lower()
+        transaction = Transaction(
+            transaction_date=date(2026, 1, 15),
+            description="TE\u017fCO STORES",
+            amount=Decimal("-45.00"),
+            currency="GBP",
+        )
+        db_session.add(transaction)
+        db_session.flush()
+
+        result = service.classify(transaction)
+
+        assert result is not None
+        assert result.category_id == groceries_category.id
+
+    def test_regex_fast_path_match_and_search(
+        self,
+        service: RulesClassificationService,
+        rule_repo: ClassificationRuleRepository,
+        groceries_category: Category,
+        online_shopping_category: Category,
+        db_session: Session,
+    ) -> None:
+        """Test that single-comparison regex rules keep =~ and =~~ semantics."""
+        rule_repo.create(
+            name="Amazon",
+            rule_expression='description =~ "(?i)amaz[o0]n"',
+            category_id=online_shopping_category.id,
+            priority=10,
+        )
+        rule_repo.create(
+            name="Tesco",
+            rule_expression='description =~~ "(?i)tesco +stores"',
+            category_id=groceries_category.id,
+            priority=20,
+        )
+        db_session.flush()
+        service.reload_rules()
+
+        descriptions = {
+            "AMAZ0N MARKETPLACE": online_shopping_category.id,
+            "PAYPAL *AMAZON": None,
+            "CARD PAYMENT TESCO STORES 123": groceries_category.id,
+            "TESCO EXPRESS": None,
+        }
+        for description, expected in descriptions.items():
+            transaction = Transaction(
+                transaction_date=date(2026, 1, 15),
+                description=description,
+                amount=Decimal("-10.00"),
+                currency="GBP",
+            )
+            result = service.classify(transaction)
+            if expected is None:
+                assert result is None, description
+            else:
+                assert result is not None, description
+                assert result.category_id == expected
+
 
 class TestRulesClassificationServiceTestRule:
     """Tests for rule expression testing."""
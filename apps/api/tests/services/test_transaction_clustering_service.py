@@ -2,7 +2,7 @@
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from finance_api.models.transaction import Transaction
 from finance_api.services.transaction_clustering_service import (
@@ -100,6 +100,14 @@ class TestNormalizeDescription:
         assert "AMAZON" in service.normalize_description("AMAZON.CO.UK")
         assert "NETFLIX" in service.normalize_description("NETFLIX.COM")
 
+    def test_removes_non_ascii_digits(self) -> None:
+        """Test that Unicode digits are removed like ASCII ones."""
+        service = TransactionClusteringService()
+
+        result = service.normalize_description("CAF\u00c9 \u0661\u0662\u0663*NERO 42")
+
+        assert result == "CAF\u00c9 NERO"
+
 
 class TestExtractClusterKey:
     """Tests for cluster key extraction."""
@@ -149,6 +157,118 @@ class TestExtractClusterKey:
 
         assert all(k == "TESCO" for k in keys)
 
+    def test_normalizes_repeated_description_once(self) -> None:
+        """Test that repeated descriptions reuse the cached key."""
+        service = TransactionClusteringService()
+
+        with patch.object(
+            service,
+            "_uppercase_and_remove",
+            wraps=service._uppercase_and_remove,
+        ) as remove:
+            first = service.extract_cluster_key("TESCO STORES 1234")
+            second = service.extract_cluster_key("TESCO STORES 1234")
+
+        assert first == second == "TESCO"
+        assert remove.call_count == 1
+
+    def test_normalizes_only_leading_token(self) -> None:
+        """Test that a significant first token decides the key on its own."""
+        service = TransactionClusteringService()
+
+        with patch.object(service, "normalize_description") as normalize:
+            key = service.extract_cluster_key("12*Tesco.com STORES LONDON")
+
+        assert key == "TESCO"
+        normalize.assert_not_called()
+
+    def test_falls_back_when_leading_token_is_insignificant(self) -> None:
+        """Test that keys are found past leading suffixes and numbers."""
+        service = TransactionClusteringService()
+
+        assert service.extract_cluster_key("CARD 1234 PAYMENT TO TESCO") == "TO"
+        assert service.extract_cluster_key("  LTD 42 STORES") == "UNCLUSTERED"
+
+
+class TestExtractClusterKeys:
+    """Tests for batch cluster key extraction."""
+
+    DESCRIPTIONS = [
+        "TESCO STORES 1234",
+        "card payment to sainsburys",
+        "AMAZON.CO.UK*AB12CD",
+        "STORES LTD 42",
+        "1234567890",
+        "ZAKUP PRZY KARTY NETFLIX.COM",
+        "CAF\u00c9 NERO \u0661\u0662",
+        "UBER\tTRIP",
+        "TESCO STORES 1234",
+    ]
+
+    def test_vectorized_keys_match_single_extraction(self) -> None:
+        """Test that Arrow-computed keys match extract_cluster_key()."""
+        strip_patterns = ["zakup przy karty"]
+        service = TransactionClusteringService(strip_patterns=strip_patterns)
+        service.VECTORIZE_THRESHOLD = 1
+        reference = TransactionClusteringService(strip_patterns=strip_patterns)
+
+        with patch.object(
+            service,
+            "_remove_numbers_and_specials",
+            wraps=service._remove_numbers_and_specials,
+        ) as remove:
+            keys = service.extract_cluster_keys(self.DESCRIPTIONS)
+
+        assert keys == [reference.extract_cluster_key(d) for d in self.DESCRIPTIONS]
+        # Only the non-ASCII and tab-containing descriptions fall back
+        assert remove.call_count == 2
+
+    def test_vectorized_keys_across_chunks(self) -> None:
+        """Test that keys stay in order when the batch is split into chunks."""
+        service = TransactionClusteringService()
+        service.VECTORIZE_THRESHOLD = 1
+        service.VECTORIZE_CHUNK_SIZE = 2
+        reference = TransactionClusteringService()
+
+        keys = service.extract_cluster_keys(self.DESCRIPTIONS)
+
+        assert keys == [reference.extract_cluster_key(d) for d in self.DESCRIPTIONS]
+
+    def test_keys_are_interned(self) -> None:
+        """Test that equal keys share a single string object."""
+        service = TransactionClusteringService()
+        service.VECTORIZE_THRESHOLD = 1
+
+        keys = service.extract_cluster_keys(["TESCO STORES 1", "TESCO EXPRESS 2"])
+        single = TransactionClusteringService().extract_cluster_key("tesco 3")
+
+        assert keys[0] is keys[1]
+        assert keys[0] is single
+
+    def test_resolves_each_distinct_description_once(self) -> None:
+        """Test that repeated descriptions in a batch are resolved once."""
+        service = TransactionClusteringService()
+        descriptions = ["TESCO 1", "AMAZON", "TESCO 1", "AMAZON", "TESCO 1"]
+
+        with patch.object(
+            service, "extract_cluster_key", wraps=service.extract_cluster_key
+        ) as extract:
+            keys = service.extract_cluster_keys(descriptions)
+
+        assert keys == ["TESCO", "AMAZON", "TESCO", "AMAZON", "TESCO"]
+        assert extract.call_count == 2
+
+    def test_small_batches_use_single_extraction(self) -> None:
+        """Test that batches below the threshold are not vectorized."""
+        service = TransactionClusteringService()
+
+        with patch.object(service, "_vectorized_cluster_keys") as vectorized:
+            keys = service.extract_cluster_keys(self.DESCRIPTIONS)
+
+        vectorized.assert_not_called()
+        assert keys[0] == "TESCO"
+        assert keys[4] == "UNCLUSTERED"
+
 
 class TestComputeClusterHash:
     """Tests for cluster hash computation."""
@@ -179,6 +299,17 @@ class TestComputeClusterHash:
 
         assert len(result) == 64
 
+    def test_hash_is_stable_sha256(self) -> None:
+        """Test that hashes stay compatible with stored sessions and proposals."""
+        service = TransactionClusteringService()
+
+        service.compute_cluster_hash("TESCO")
+        result = service.compute_cluster_hash("TESCO")
+
+        assert result == (
+            "57aac6fa804efdc321f5b71b59b65252a85d125c4daf2c1ab85addcb98b1b0a7"
+        )
+
 
 class TestClusterTransactions:
     """Tests for transaction clustering."""
@@ -246,6 +377,27 @@ class TestClusterTransactions:
         assert clusters[0].cluster_key == "TESCO"  # Larger (4)
         assert clusters[1].cluster_key == "AMAZON"  # Smaller (2)
 
+    def test_equal_sizes_keep_first_seen_order(self) -> None:
+        """Test that clusters of equal size stay in first-seen order."""
+        service = TransactionClusteringService(min_cluster_size=1)
+        transactions = [
+            create_mock_transaction(1, "NETFLIX"),
+            create_mock_transaction(2, "AMAZON"),
+            create_mock_transaction(3, "TESCO"),
+            create_mock_transaction(4, "TESCO"),
+            create_mock_transaction(5, "UBER"),
+            create_mock_transaction(6, "UBER"),
+        ]
+
+        clusters = service.cluster_transactions(transactions)
+
+        assert [c.cluster_key for c in clusters] == [
+            "TESCO",
+            "UBER",
+            "NETFLIX",
+            "AMAZON",
+        ]
+
     def test_collects_sample_descriptions(self) -> None:
         """Test that unique sample descriptions are collected."""
         service = TransactionClusteringService(max_samples=3)
@@ -276,6 +428,20 @@ class TestClusterTransactions:
 
         assert len(clusters[0].sample_descriptions) == 2
 
+    def test_skips_sample_descriptions_when_not_requested(self) -> None:
+        """Test that samples are left empty when compute_samples is False."""
+        service = TransactionClusteringService()
+        transactions = [
+            create_mock_transaction(1, "TESCO 1"),
+            create_mock_transaction(2, "TESCO 2"),
+        ]
+
+        clusters = service.cluster_transactions(transactions, compute_samples=False)
+
+        assert len(clusters) == 1
+        assert clusters[0].size == 2
+        assert clusters[0].sample_descriptions == []
+
     def test_handles_empty_descriptions(self) -> None:
         """Test handling of transactions with empty descriptions."""
         service = TransactionClusteringService(min_cluster_size=1)
@@ -359,6 +525,25 @@ class TestGetClusterStatistics:
         assert stats.smallest_cluster_size == 2
         assert stats.average_cluster_size == (10 + 5 + 2) / 3
 
+    def test_calculates_sizes_for_unsorted_clusters(self) -> None:
+        """Test size statistics when clusters are not ordered by size."""
+        service = TransactionClusteringService()
+        clusters = [
+            TransactionCluster(
+                cluster_key=key,
+                cluster_hash=f"hash_{key}",
+                transactions=[create_mock_transaction(i, key) for i in range(size)],
+            )
+            for key, size in [("A", 3), ("B", 7), ("C", 1), ("D", 4)]
+        ]
+
+        stats = service.get_cluster_statistics(clusters, total_transactions=20)
+
+        assert stats.clustered_transactions == 15
+        assert stats.largest_cluster_size == 7
+        assert stats.smallest_cluster_size == 1
+        assert stats.average_cluster_size == 15 / 4
+
     def test_handles_empty_clusters(self) -> None:
         """Test statistics for empty cluster list."""
         service = TransactionClusteringService()
@@ -521,6 +706,20 @@ class TestTransactionCluster:
 
         assert cluster.size == 0
 
+    def test_transaction_ids(self) -> None:
+        """Test that transaction_ids holds the member transaction IDs."""
+        cluster = TransactionCluster(
+            cluster_key="TEST",
+            cluster_hash="hash",
+            transactions=[
+                create_mock_transaction(1, "T"),
+                create_mock_transaction(2, "T"),
+            ],
+        )
+
+        assert cluster.transaction_ids == frozenset({1, 2})
+        assert TransactionCluster("EMPTY", "hash").transaction_ids == frozenset()
+
 
 class TestStripPatterns:
     """Tests for strip patterns functionality."""